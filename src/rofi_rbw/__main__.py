@@ -1,8 +1,17 @@
-from .rofi_rbw import RofiRbw
+from .argument_parsing import parse_arguments
 
 
 def main():
-    RofiRbw().main()
+    args = parse_arguments()
+
+    if args.daemon:
+        from .daemon import Daemon
+
+        Daemon().serve()
+    else:
+        from .rofi_rbw import RofiRbw
+
+        RofiRbw(args).main()
 
 
 if __name__ == "__main__":
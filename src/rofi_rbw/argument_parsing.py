@@ -12,6 +12,13 @@ from .models.targets import Target, TypeTarget
 from .paths import config_file_locations
 
 
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, not {value}")
+    return number
+
+
 def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser = configargparse.ArgumentParser(
         description="Insert or copy passwords and usernames from Bitwarden using rofi or rofi-likes.",
@@ -31,6 +38,13 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--prompt", "-r", dest="prompt", action="store", default="Choose entry", help="Set rofi-rbw's prompt"
     )
+    parser.add_argument(
+        "--filter",
+        dest="filter",
+        action="store",
+        default=None,
+        help="Only show entries matching this query, tolerating typos",
+    )
     parser.add_argument(
         "--selector-args",
         dest="selector_args",
@@ -43,7 +57,7 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
         dest="selector",
         action="store",
         type=str,
-        choices=["rofi", "wofi", "fuzzel", "bemenu"],
+        choices=["rofi", "rofi-script", "wofi", "fuzzel", "bemenu"],
         default=None,
         help="Choose the selector frontend",
     )
@@ -73,6 +87,12 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
         default=0,
         help="Limit the duration in seconds passwords stay in your clipboard. When not set or <= 0, passwords stay indefinitely",
     )
+    parser.add_argument(
+        "--clipboard-queue",
+        dest="clipboard_queue",
+        action="store_true",
+        help="When copying several targets, serve them one after another: each paste advances to the next one",
+    )
     parser.add_argument(
         "--no-help", dest="show_help", action="store_false", help="Don't show a help message about the shortcuts"
     )
@@ -95,6 +115,14 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="Don't save history in cache")
     parser.set_defaults(use_cache=True)
+    parser.add_argument(
+        "--cache-half-life",
+        dest="cache_half_life",
+        action="store",
+        type=positive_float,
+        default=30,
+        help="Number of days after which the usage of an entry counts half as much for sorting",
+    )
     parser.add_argument(
         "--use-notify-send",
         dest="use_notify_send",
@@ -154,6 +182,28 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
         default=1000,
         help="Set the delay to wait for a 'delay' step",
     )
+    parser.add_argument(
+        "--prefetch",
+        dest="prefetch",
+        action="store",
+        type=int,
+        default=3,
+        help="Fetch this many of the most used entries while the selector is shown",
+    )
+    parser.add_argument(
+        "--debug",
+        dest="debug",
+        action="store_true",
+        help="Print how long each step of the startup takes",
+    )
+    parser.set_defaults(debug=False)
+    parser.add_argument(
+        "--daemon",
+        dest="daemon",
+        action="store_true",
+        help="Keep the list of entries in memory and serve it to other invocations of rofi-rbw",
+    )
+    parser.set_defaults(daemon=False)
 
     parsed_args = parser.parse_args(argv)
 
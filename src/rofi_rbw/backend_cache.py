@@ -0,0 +1,62 @@
+import json
+import os
+from hashlib import sha1
+from json import JSONDecodeError
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from .abstractionhelper import is_wayland
+from .paths import backend_cache_file
+
+
+class BackendCache:
+    def __init__(self) -> None:
+        self.key = self.__environment_key()
+        self.backends = self.__load()
+
+    def get(self, kind: str) -> str | None:
+        return self.backends.get(kind)
+
+    def set(self, kind: str, name: str) -> None:
+        if self.backends.get(kind) == name:
+            return
+
+        self.backends[kind] = name
+        temporary_file = None
+        try:
+            backend_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=backend_cache_file.parent, prefix=f"{backend_cache_file.name}.", delete=False
+            ) as f:
+                temporary_file = Path(f.name)
+                json.dump({"key": self.key, "backends": self.backends}, f)
+            temporary_file.replace(backend_cache_file)
+        except OSError:
+            if temporary_file is not None:
+                temporary_file.unlink(missing_ok=True)
+
+    def __load(self) -> dict[str, str]:
+        try:
+            data = json.loads(backend_cache_file.read_text())
+        except (OSError, JSONDecodeError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return {}
+
+        backends = data.get("backends")
+        if not isinstance(backends, dict):
+            return {}
+
+        return {kind: name for kind, name in backends.items() if isinstance(name, str)}
+
+    def __environment_key(self) -> str:
+        m = sha1()
+        m.update(str(is_wayland()).encode())
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            try:
+                modified = os.stat(directory).st_mtime_ns
+            except OSError:
+                modified = 0
+            m.update(f"{directory}:{modified}\n".encode())
+        return m.hexdigest()
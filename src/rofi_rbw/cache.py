@@ -1,35 +1,112 @@
-from math import floor
+import fcntl
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Thread
+from typing import TextIO
 
 from .models.entry import Entry
-from .paths import cache_file
+from .paths import cache_file, journal_file
+
+COMPACTION_SIZE = 4096
+MINIMUM_SCORE = 0.01
+
+
+@dataclass
+class Usage:
+    score: float
+    last_used: float
+
+    def decayed(self, now: float, half_life: float) -> float:
+        return self.score * 0.5 ** ((now - self.last_used) / half_life)
 
 
 class Cache:
-    def __init__(self):
+    def __init__(self, half_life_days: float = 30):
         cache_file.parent.mkdir(exist_ok=True)
-        self.cache = dict()
+        self.half_life = half_life_days * 24 * 60 * 60
+        self.usages: dict[str, Usage] | None = None
+        self.cache: dict[str, Usage] = dict()
+
+    def load(self) -> None:
+        with self.__locked_journal(fcntl.LOCK_SH) as journal:
+            self.usages = self.__read_usages(journal)
 
     def sorted(self, entries: list[Entry]) -> list[Entry]:
+        if self.usages is None:
+            self.load()
+
         hashed_entries = {entry.hashed: entry for entry in entries}
-        sorted_entries = []
+        self.cache = {hashed: usage for hashed, usage in self.usages.items() if hashed in hashed_entries}
+
+        now = time.time()
+        ranked = sorted(self.cache, key=lambda hashed: self.cache[hashed].decayed(now, self.half_life), reverse=True)
+        sorted_entries = [hashed_entries.pop(hashed) for hashed in ranked]
+
+        return [*sorted_entries, *hashed_entries.values()]
+
+    def most_used(self, entries: list[Entry], amount: int) -> list[Entry]:
+        return [entry for entry in entries if entry.hashed in self.cache][:amount]
+
+    def update(self, entry: Entry):
+        with self.__locked_journal(fcntl.LOCK_SH) as journal:
+            journal.write(f"{time.time():.0f} {entry.hashed}\n")
+            needs_compaction = journal.tell() > COMPACTION_SIZE
+
+        if needs_compaction:
+            Thread(target=self.compact).start()
+
+    def compact(self) -> None:
+        with self.__locked_journal(fcntl.LOCK_EX) as journal:
+            usages = self.__read_usages(journal)
+            now = time.time()
+
+            temporary_file = cache_file.with_name(f"{cache_file.name}.tmp")
+            with temporary_file.open("w") as f:
+                for hashed, usage in sorted(
+                    usages.items(), key=lambda i: i[1].decayed(now, self.half_life), reverse=True
+                ):
+                    if usage.decayed(now, self.half_life) >= MINIMUM_SCORE:
+                        f.write(f"{usage.score:.4f} {usage.last_used:.0f} {hashed}\n")
+            temporary_file.replace(cache_file)
+
+            journal.truncate(0)
+
+    @contextmanager
+    def __locked_journal(self, operation: int) -> Iterator[TextIO]:
+        with journal_file.open("a+") as journal:
+            fcntl.flock(journal, operation)
+            yield journal
+
+    def __read_usages(self, journal: TextIO) -> dict[str, Usage]:
+        usages = {}
 
         if cache_file.exists():
+            legacy_last_used = cache_file.stat().st_mtime
             with cache_file.open() as f:
                 for line in f:
-                    stripped_line = line.strip()
-                    if stripped_line:
-                        amount, hashed = stripped_line.split(" ", maxsplit=1)
-                        try:
-                            sorted_entries.append(hashed_entries.pop(hashed))
-                            self.cache[hashed] = int(amount)
-                        except KeyError:
-                            pass
+                    try:
+                        match line.split():
+                            case [score, last_used, hashed]:
+                                usages[hashed] = Usage(float(score), float(last_used))
+                            case [amount, hashed]:
+                                usages[hashed] = Usage(float(amount), legacy_last_used)
+                    except ValueError:
+                        continue
 
-        return [*sorted_entries, *hashed_entries.values()]
+        journal.seek(0)
+        events = []
+        for line in journal:
+            match line.split():
+                case [timestamp, hashed]:
+                    try:
+                        events.append((float(timestamp), hashed))
+                    except ValueError:
+                        continue
 
-    def update(self, entry: Entry):
-        self.cache[entry.hashed] = self.cache.get(entry.hashed, 0) + 1.1
+        for timestamp, hashed in sorted(events):
+            usage = usages.get(hashed, Usage(0, timestamp))
+            usages[hashed] = Usage(usage.decayed(timestamp, self.half_life) + 1, timestamp)
 
-        with cache_file.open("w") as f:
-            for hashed, n in sorted(self.cache.items(), key=lambda i: i[1], reverse=True):
-                f.write(f"{floor(n)} {hashed}\n")
+        return usages
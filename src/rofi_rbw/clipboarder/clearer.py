@@ -0,0 +1,16 @@
+import sys
+import time
+
+from .clipboarder import Clipboarder
+
+
+def main() -> None:
+    name, clear = sys.argv[1:3]
+    key, digest = sys.stdin.readline().split()
+
+    time.sleep(int(clear))
+    Clipboarder.best_option(name).clear_clipboard_if_unchanged(key, digest)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,17 @@
+import hmac
+import json
+import os
+import sys
 from abc import ABC, abstractmethod
+from hashlib import sha256
+from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired
+from time import monotonic
 
 
 class Clipboarder(ABC):
+    _last_copied_key: bytes = b""
+    _last_copied_digest: str | None = None
+
     @staticmethod
     def best_option(name: str | None = None) -> "Clipboarder":
         from .noop import NoopClipboarder
@@ -31,9 +41,79 @@ class Clipboarder(ABC):
         pass
 
     @abstractmethod
-    def clear_clipboard_after(self, clear: int) -> None:
+    def fetch_clipboard_content(self) -> str | None:
+        pass
+
+    @abstractmethod
+    def clear_clipboard(self) -> None:
         pass
 
+    def clear_clipboard_after(self, clear: int) -> None:
+        if clear <= 0 or self._last_copied_digest is None:
+            return
+
+        from ..daemon_client import DaemonClient
+
+        key = self._last_copied_key.hex()
+        if not DaemonClient().clear_clipboard_after(self.name(), clear, key, self._last_copied_digest):
+            helper = Popen(
+                [sys.executable, "-m", "rofi_rbw.clipboarder.clearer", self.name(), str(clear)],
+                stdin=PIPE,
+                stdout=DEVNULL,
+                stderr=DEVNULL,
+                encoding="utf-8",
+                start_new_session=True,
+            )
+            helper.stdin.write(f"{key} {self._last_copied_digest}\n")
+            helper.stdin.close()
+
+        self._last_copied_key = b""
+        self._last_copied_digest = None
+
+    def copy_queue(self, values: list[str], clear: int) -> bool:
+        if self._paste_once_command() is None:
+            return False
+
+        helper = Popen(
+            [sys.executable, "-m", "rofi_rbw.clipboarder.paste_queue", self.name()],
+            stdin=PIPE,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            encoding="utf-8",
+            start_new_session=True,
+        )
+        helper.stdin.write(json.dumps({"values": values, "clear": clear}))
+        helper.stdin.close()
+        return True
+
+    def serve_queue(self, values: list[str], clear: int) -> None:
+        deadline = monotonic() + clear if clear > 0 else None
+        for value in values:
+            process = Popen(self._paste_once_command(), stdin=PIPE, stdout=DEVNULL, stderr=DEVNULL, encoding="utf-8")
+            process.stdin.write(value)
+            process.stdin.close()
+            try:
+                process.wait(None if deadline is None else max(deadline - monotonic(), 0))
+            except TimeoutExpired:
+                process.terminate()
+                return
+
+    def clear_clipboard_if_unchanged(self, key: str, digest: str) -> None:
+        content = self.fetch_clipboard_content()
+        if content is not None and hmac.compare_digest(self.digest(content, bytes.fromhex(key)), digest):
+            self.clear_clipboard()
+
+    @staticmethod
+    def digest(characters: str, key: bytes) -> str:
+        return hmac.new(key, characters.encode(), sha256).hexdigest()
+
+    def _paste_once_command(self) -> list[str] | None:
+        return None
+
+    def _remember(self, characters: str) -> None:
+        self._last_copied_key = os.urandom(32)
+        self._last_copied_digest = self.digest(characters, self._last_copied_key)
+
 
 class NoClipboarderFoundException(Exception):
     def __str__(self) -> str:
@@ -13,5 +13,11 @@ class NoopClipboarder(Clipboarder):
     def copy_to_clipboard(self, characters: str) -> None:
         raise NoClipboarderFoundException()
 
+    def fetch_clipboard_content(self) -> str | None:
+        raise NoClipboarderFoundException()
+
+    def clear_clipboard(self) -> None:
+        raise NoClipboarderFoundException()
+
     def clear_clipboard_after(self, clear: int) -> None:
         raise NoClipboarderFoundException()
@@ -0,0 +1,14 @@
+import json
+import sys
+
+from .clipboarder import Clipboarder
+
+
+def main() -> None:
+    queue = json.load(sys.stdin)
+
+    Clipboarder.best_option(sys.argv[1]).serve_queue(queue["values"], queue["clear"])
+
+
+if __name__ == "__main__":
+    main()
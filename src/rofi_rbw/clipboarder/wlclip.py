@@ -1,13 +1,12 @@
-import time
 from subprocess import run
 
 from ..abstractionhelper import is_installed, is_wayland
 from .clipboarder import Clipboarder
 
+PASSWORD_MANAGER_HINT = "x-kde-passwordManagerHint"
 
-class WlClipboarder(Clipboarder):
-    __last_copied_characters: str | None
 
+class WlClipboarder(Clipboarder):
     @staticmethod
     def supported() -> bool:
         return is_wayland() and is_installed("wl-copy")
@@ -19,15 +18,17 @@ class WlClipboarder(Clipboarder):
     def copy_to_clipboard(self, characters: str) -> None:
         run(["wl-copy", "--sensitive"], input=characters, encoding="utf-8")
 
-        self.__last_copied_characters = characters
-
-    def clear_clipboard_after(self, clear: int) -> None:
-        if clear > 0:
-            time.sleep(clear)
+        self._remember(characters)
 
-            if self.__fetch_clipboard_content() == self.__last_copied_characters:
-                run(["wl-copy", "--clear"])
-                self.__last_copied_characters = None
+    def fetch_clipboard_content(self) -> str | None:
+        types = run(["wl-paste", "--list-types"], capture_output=True, encoding="utf-8").stdout.split()
+        if PASSWORD_MANAGER_HINT not in types:
+            return None
 
-    def __fetch_clipboard_content(self) -> str:
         return run(["wl-paste", "-n"], capture_output=True, encoding="utf-8").stdout
+
+    def clear_clipboard(self) -> None:
+        run(["wl-copy", "--clear"])
+
+    def _paste_once_command(self) -> list[str] | None:
+        return ["wl-copy", "--foreground", "--paste-once", "--sensitive"]
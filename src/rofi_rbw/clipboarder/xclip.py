@@ -1,4 +1,3 @@
-import time
 from subprocess import run
 
 from ..abstractionhelper import is_installed, is_wayland
@@ -6,8 +5,6 @@ from .clipboarder import Clipboarder
 
 
 class XClipClipboarder(Clipboarder):
-    __last_copied_characters: str | None
-
     @staticmethod
     def supported() -> bool:
         return not is_wayland() and is_installed("xclip")
@@ -19,16 +16,13 @@ class XClipClipboarder(Clipboarder):
     def copy_to_clipboard(self, characters: str) -> None:
         run(["xclip", "-in", "-selection", "clipboard"], input=characters, encoding="utf-8")
 
-        self.__last_copied_characters = characters
+        self._remember(characters)
 
-    def clear_clipboard_after(self, clear: int) -> None:
-        if clear > 0:
-            time.sleep(clear)
+    def fetch_clipboard_content(self) -> str | None:
+        return run(["xclip", "-o", "-selection", "clipboard"], capture_output=True, encoding="utf-8").stdout
 
-            # Only clear clipboard if nothing has been copied since the password
-            if self.__fetch_clipboard_content() == self.__last_copied_characters:
-                self.copy_to_clipboard("")
-                self.__last_copied_characters = None
+    def clear_clipboard(self) -> None:
+        run(["xclip", "-in", "-selection", "clipboard"], input="", encoding="utf-8")
 
-    def __fetch_clipboard_content(self) -> str:
-        return run(["xclip", "-o", "-selection", "clipboard"], capture_output=True, encoding="utf-8").stdout
+    def _paste_once_command(self) -> list[str] | None:
+        return ["xclip", "-in", "-selection", "clipboard", "-loops", "1", "-quiet"]
@@ -1,4 +1,3 @@
-import time
 from subprocess import run
 
 from ..abstractionhelper import is_installed, is_wayland
@@ -6,8 +5,6 @@ from .clipboarder import Clipboarder
 
 
 class XSelClipboarder(Clipboarder):
-    __last_copied_characters: str | None
-
     @staticmethod
     def supported() -> bool:
         return not is_wayland() and is_installed("xsel")
@@ -19,18 +16,9 @@ class XSelClipboarder(Clipboarder):
     def copy_to_clipboard(self, characters: str) -> None:
         run(["xsel", "--input", "--clipboard"], input=characters, encoding="utf-8")
 
-        self.__last_copied_characters = characters
-
-    def clear_clipboard_after(self, clear: int) -> None:
-        if clear > 0:
-            time.sleep(clear)
+        self._remember(characters)
 
-            # Only clear clipboard if nothing has been copied since the password
-            if self.__fetch_clipboard_content() == self.__last_copied_characters:
-                run(["xsel", "--clear", "--clipboard"])
-                self.__last_copied_characters = None
-
-    def __fetch_clipboard_content(self) -> str:
+    def fetch_clipboard_content(self) -> str | None:
         return run(
             [
                 "xsel",
@@ -40,3 +28,6 @@ class XSelClipboarder(Clipboarder):
             capture_output=True,
             encoding="utf-8",
         ).stdout
+
+    def clear_clipboard(self) -> None:
+        run(["xsel", "--clear", "--clipboard"])
@@ -0,0 +1,91 @@
+import json
+import os
+import signal
+import socketserver
+from dataclasses import asdict
+from json import JSONDecodeError
+from threading import Lock, Timer
+from typing import Any
+
+from .clipboarder.clipboarder import Clipboarder
+from .models.entry import Entry
+from .paths import socket_file
+from .rbw import Rbw
+
+
+class Daemon:
+    def __init__(self) -> None:
+        self.rbw = Rbw()
+        self.entries: list[Entry] | None = None
+        self.database_modified: float | None = None
+        self.lock = Lock()
+
+    def serve(self) -> None:
+        socket_file.parent.mkdir(parents=True, exist_ok=True)
+        socket_file.unlink(missing_ok=True)
+        signal.signal(signal.SIGTERM, lambda signum, frame: exit(0))
+
+        previous_umask = os.umask(0o177)
+        try:
+            server = _Server(self)
+        finally:
+            os.umask(previous_umask)
+
+        with server:
+            try:
+                server.serve_forever()
+            finally:
+                socket_file.unlink(missing_ok=True)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        match request.get("command"):
+            case "list":
+                return {"entries": self.list_entries()}
+            case "invalidate":
+                self.invalidate()
+                return {}
+            case "clear-clipboard":
+                self.clear_clipboard_after(request["clipboarder"], request["clear"], request["key"], request["digest"])
+                return {}
+            case _:
+                return {"error": f"Unknown command: {request.get('command')}"}
+
+    def list_entries(self) -> list[dict[str, Any]] | None:
+        with self.lock:
+            if not self.rbw.is_unlocked():
+                self.entries = None
+                return None
+
+            database_modified = self.rbw.database_modified()
+            if self.entries is None or database_modified is None or database_modified != self.database_modified:
+                self.entries = self.rbw.list_entries()
+                self.database_modified = database_modified
+
+            return [asdict(entry) for entry in self.entries]
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.entries = None
+
+    def clear_clipboard_after(self, clipboarder: str, clear: int, key: str, digest: str) -> None:
+        timer = Timer(clear, Clipboarder.best_option(clipboarder).clear_clipboard_if_unchanged, [key, digest])
+        timer.daemon = True
+        timer.start()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except JSONDecodeError:
+            return
+
+        self.wfile.write(json.dumps(self.server.rofi_rbw_daemon.handle(request)).encode() + b"\n")
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, daemon: Daemon) -> None:
+        self.rofi_rbw_daemon = daemon
+        super().__init__(str(socket_file), _RequestHandler)
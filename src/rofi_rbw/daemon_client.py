@@ -0,0 +1,39 @@
+import json
+import socket
+from json import JSONDecodeError
+from typing import Any
+
+from .models.entry import Entry
+from .paths import socket_file
+
+
+class DaemonClient:
+    def list_entries(self) -> list[Entry] | None:
+        response = self.__request({"command": "list"})
+        if response is None or response.get("entries") is None:
+            return None
+
+        return [Entry(**item) for item in response["entries"]]
+
+    def invalidate(self) -> None:
+        self.__request({"command": "invalidate"})
+
+    def clear_clipboard_after(self, clipboarder: str, clear: int, key: str, digest: str) -> bool:
+        response = self.__request(
+            {"command": "clear-clipboard", "clipboarder": clipboarder, "clear": clear, "key": key, "digest": digest}
+        )
+        return response is not None and "error" not in response
+
+    def __request(self, request: dict[str, Any]) -> dict[str, Any] | None:
+        if not socket_file.exists():
+            return None
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(30)
+                connection.connect(str(socket_file))
+                connection.sendall(json.dumps(request).encode() + b"\n")
+                with connection.makefile(encoding="utf-8") as response:
+                    return json.loads(response.readline() or "null")
+        except (OSError, JSONDecodeError):
+            return None
@@ -0,0 +1,81 @@
+import re
+from ipaddress import ip_address
+from urllib.parse import urlsplit
+
+from .models.entry import Entry
+
+WEB_SCHEMES = {"", "http", "https"}
+SECOND_LEVEL_LABELS = {"ac", "co", "com", "edu", "gov", "ltd", "me", "net", "or", "org", "plc"}
+BROWSER_SUFFIX = re.compile(
+    r"\s+[-—–]\s+(Mozilla Firefox|Firefox|Google Chrome|Chromium|Brave|Vivaldi|Opera|Microsoft\s?Edge|LibreWolf|qutebrowser)$",
+    re.IGNORECASE,
+)
+HOSTNAME = re.compile(
+    r"(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z][a-z0-9-]*[a-z0-9]|\d{1,3}(?:\.\d{1,3}){3})(?::\d+)?"
+)
+WORD = re.compile(r"[a-z0-9][a-z0-9-]{2,}")
+
+
+def registrable_domain(uri: str) -> str | None:
+    if "://" not in uri:
+        uri = f"//{uri}"
+
+    try:
+        parts = urlsplit(uri.strip())
+        host = parts.hostname
+    except ValueError:
+        return None
+
+    if parts.scheme not in WEB_SCHEMES or not host or "." not in host:
+        return None
+
+    try:
+        ip_address(host)
+        return host
+    except ValueError:
+        pass
+
+    labels = host.rstrip(".").split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class DomainIndex:
+    def __init__(self, entries: list[Entry]):
+        self.domains: dict[str, set[str]] = {}
+        self.names: dict[str, set[str]] = {}
+        for entry in entries:
+            for uri in entry.uris:
+                domain = registrable_domain(uri)
+                if domain is None:
+                    continue
+                self.domains.setdefault(domain, set()).add(entry.hashed)
+                if not domain[-1].isdigit():
+                    self.names.setdefault(domain.split(".")[0], set()).add(entry.hashed)
+
+    def matches(self, window_title: str) -> list[set[str]]:
+        title = BROWSER_SUFFIX.sub("", window_title.strip()).lower()
+
+        by_domain = set()
+        for hostname in HOSTNAME.findall(title):
+            by_domain |= self.domains.get(registrable_domain(hostname), set())
+
+        by_name = set()
+        for word in WORD.findall(title):
+            by_name |= self.names.get(word, set())
+
+        return [by_domain, by_name - by_domain]
+
+    def ranked(self, entries: list[Entry], window_title: str | None) -> list[Entry]:
+        if not window_title:
+            return entries
+
+        tiers = [tier for tier in self.matches(window_title) if tier]
+        if not tiers:
+            return entries
+
+        ranked = [[] for _ in range(len(tiers) + 1)]
+        for entry in entries:
+            ranked[next((i for i, tier in enumerate(tiers) if entry.hashed in tier), len(tiers))].append(entry)
+        return [entry for tier in ranked for entry in tier]
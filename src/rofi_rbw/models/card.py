@@ -35,6 +35,4 @@ class Card(DetailedEntry):
             case Targets.CODE:
                 return self.code
             case _:
-                return next(
-                    (field.value for field in self.fields if field.key == target.raw.removesuffix(" (field)")), None
-                )
+                return self._field_value(target)
@@ -1,9 +1,11 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from subprocess import run
 
 from .detailed_entry import DetailedEntry
 from .field import Field
 from .targets import Target, Targets, TypeTarget, TypeTargets
+from .totp import Totp
 
 
 @dataclass(frozen=True)
@@ -14,6 +16,7 @@ class Credentials(DetailedEntry):
     notes: str | None = ""
     uris: list[str] = field(default_factory=list)
     fields: list[Field] = field(default_factory=list)
+    totp_secret: str | None = None
 
     def __getitem__(self, target: Target) -> str | None:
         match target:
@@ -28,9 +31,7 @@ class Credentials(DetailedEntry):
             case _ if target.is_uri():
                 return self.uris[target.uri_index()]
             case _:
-                return next(
-                    (field.value for field in self.fields if field.key == target.raw.removesuffix(" (field)")), None
-                )
+                return self._field_value(target)
 
     @property
     def default_target(self) -> list[Target]:
@@ -41,13 +42,33 @@ class Credentials(DetailedEntry):
         return [Targets.USERNAME, TypeTargets.TAB, Targets.PASSWORD]
 
     @property
-    def totp(self):
+    def totp(self) -> str:
         if not self.has_totp:
             return ""
 
+        if self._totp_generator is not None:
+            return self._totp_generator.code()
+
         command = ["rbw", "code", self.name]
         if self.username:
             command.extend([self.username])
         if self.folder:
             command.extend(["--folder", self.folder])
         return run(command, capture_output=True, encoding="utf-8").stdout.strip()
+
+    @property
+    def totp_validity(self) -> int | None:
+        if not self.has_totp or self._totp_generator is None:
+            return None
+
+        return self._totp_generator.remaining()
+
+    @cached_property
+    def _totp_generator(self) -> Totp | None:
+        if not self.totp_secret:
+            return None
+
+        try:
+            return Totp.parse(self.totp_secret)
+        except ValueError:
+            return None
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from rofi_rbw.models.field import Field
 from rofi_rbw.models.targets import Target, TypeTarget
@@ -25,10 +26,20 @@ class DetailedEntry(ABC):
     def default_autotype_target(self) -> list[TypeTarget]:
         pass
 
-    @property
+    @cached_property
     def autotype_sequence(self) -> list[TypeTarget] | None:
-        sequence = next((field for field in self.fields if field.key == "_autotype"), None)
+        sequence = self._field_values.get("_autotype")
         if sequence is None:
             return None
 
-        return [TypeTarget(target_string) for target_string in sequence.value.strip().split(":")]
+        return [TypeTarget(target_string) for target_string in sequence.strip().split(":")]
+
+    @cached_property
+    def _field_values(self) -> dict[str, str]:
+        values = {}
+        for item in self.fields:
+            values.setdefault(item.key, item.value)
+        return values
+
+    def _field_value(self, target: Target) -> str | None:
+        return self._field_values.get(target.raw.removesuffix(" (field)"))
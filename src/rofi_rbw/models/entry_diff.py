@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+
+from rofi_rbw.models.entry import Entry
+
+
+@dataclass(frozen=True)
+class EntryDiff:
+    added: list[Entry] = field(default_factory=list)
+    removed: list[Entry] = field(default_factory=list)
+    renamed: dict[str, Entry] = field(default_factory=dict)
+
+    @staticmethod
+    def between(before: list[Entry], after: list[Entry]) -> "EntryDiff":
+        before_hashes = {entry.hashed for entry in before}
+        after_hashes = {entry.hashed for entry in after}
+        added = [entry for entry in after if entry.hashed not in before_hashes]
+        removed = [entry for entry in before if entry.hashed not in after_hashes]
+
+        removed_by_identity = {}
+        for entry in removed:
+            removed_by_identity.setdefault(EntryDiff.__identity(entry), []).append(entry)
+
+        renamed = {}
+        for entry in added:
+            candidates = removed_by_identity.get(EntryDiff.__identity(entry))
+            if candidates:
+                renamed[candidates.pop(0).hashed] = entry
+
+        renamed_hashes = {entry.hashed for entry in renamed.values()}
+        return EntryDiff(
+            [entry for entry in added if entry.hashed not in renamed_hashes],
+            [entry for entry in removed if entry.hashed not in renamed],
+            renamed,
+        )
+
+    def apply(self, entries: list[Entry]) -> list[Entry]:
+        removed_hashes = {entry.hashed for entry in self.removed}
+        return [
+            self.renamed.get(entry.hashed, entry) for entry in entries if entry.hashed not in removed_hashes
+        ] + self.added
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed)
+
+    def __str__(self) -> str:
+        if not self:
+            return "no changes"
+
+        return ", ".join(
+            f"{amount} {change}"
+            for amount, change in [
+                (len(self.added), "added"),
+                (len(self.removed), "removed"),
+                (len(self.renamed), "renamed"),
+            ]
+            if amount
+        )
+
+    @staticmethod
+    def __identity(entry: Entry) -> tuple[str, str, tuple[str, ...]]:
+        return entry.type, entry.username, tuple(entry.uris)
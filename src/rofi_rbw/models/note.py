@@ -14,9 +14,7 @@ class Note(DetailedEntry):
         if target == Targets.NOTES:
             return self.notes
         else:
-            return next(
-                (field.value for field in self.fields if field.key == target.raw.removesuffix(" (field)")), None
-            )
+            return self._field_value(target)
 
     @property
     def default_target(self) -> list[Target]:
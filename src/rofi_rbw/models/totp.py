@@ -0,0 +1,75 @@
+import base64
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import parse_qs, urlparse
+
+STEAM_ALPHABET = "23456789BCDFGHJKMNPQRTVWXY"
+ALGORITHMS = {"sha1": hashlib.sha1, "sha256": hashlib.sha256, "sha512": hashlib.sha512}
+
+
+@dataclass(frozen=True)
+class Totp:
+    secret: bytes
+    digits: int = 6
+    period: int = 30
+    algorithm: str = "sha1"
+    steam: bool = False
+
+    @staticmethod
+    def parse(value: str) -> "Totp":
+        if value.startswith("steam://"):
+            return Totp(decode_secret(value.removeprefix("steam://")), digits=5, steam=True)
+
+        if not value.startswith("otpauth://"):
+            return Totp(decode_secret(value))
+
+        uri = urlparse(value)
+        if uri.netloc != "totp":
+            raise ValueError(f"Unsupported OTP type: {uri.netloc}")
+
+        parameters = {key.lower(): values[0] for key, values in parse_qs(uri.query).items()}
+        if "secret" not in parameters:
+            raise ValueError("Missing secret")
+
+        steam = parameters.get("encoder", "").lower() == "steam"
+        algorithm = parameters.get("algorithm", "sha1").lower()
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+        return Totp(
+            decode_secret(parameters["secret"]),
+            int(parameters.get("digits", 5 if steam else 6)),
+            int(parameters.get("period", 30)),
+            algorithm,
+            steam,
+        )
+
+    def code(self, now: float | None = None) -> str:
+        return generate_code(self, int((time.time() if now is None else now) // self.period))
+
+    def remaining(self, now: float | None = None) -> int:
+        return self.period - int(time.time() if now is None else now) % self.period
+
+
+def decode_secret(secret: str) -> bytes:
+    secret = secret.replace(" ", "").replace("-", "").upper().rstrip("=")
+    return base64.b32decode(secret + "=" * (-len(secret) % 8))
+
+
+@lru_cache(maxsize=64)
+def generate_code(totp: Totp, counter: int) -> str:
+    digest = hmac.new(totp.secret, counter.to_bytes(8, "big"), ALGORITHMS[totp.algorithm]).digest()
+    offset = digest[-1] & 0x0F
+    value = int.from_bytes(digest[offset : offset + 4], "big") & 0x7FFFFFFF
+
+    if totp.steam:
+        characters = []
+        for _ in range(totp.digits):
+            value, index = divmod(value, len(STEAM_ALPHABET))
+            characters.append(STEAM_ALPHABET[index])
+        return "".join(characters)
+
+    return str(value % 10**totp.digits).zfill(totp.digits)
@@ -2,9 +2,30 @@ import os
 from pathlib import Path
 
 if os.environ.get("XDG_CACHE_HOME"):
-    cache_file = Path(os.environ.get("XDG_CACHE_HOME")) / "rofi-rbw.runcache"
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME"))
 else:
-    cache_file = Path.home() / ".cache" / "rofi-rbw.runcache"
+    cache_home = Path.home() / ".cache"
+
+cache_file = cache_home / "rofi-rbw.runcache"
+journal_file = cache_home / "rofi-rbw.runcache.journal"
+snapshot_file = cache_home / "rofi-rbw.snapshot"
+search_index_file = cache_home / "rofi-rbw.index"
+backend_cache_file = cache_home / "rofi-rbw.backends"
+
+if os.environ.get("RBW_PROFILE"):
+    socket_name = f"rofi-rbw-{os.environ.get('RBW_PROFILE')}.sock"
+else:
+    socket_name = "rofi-rbw.sock"
+
+if os.environ.get("XDG_RUNTIME_DIR"):
+    socket_file = Path(os.environ.get("XDG_RUNTIME_DIR")) / socket_name
+else:
+    socket_file = cache_home / socket_name
+
+if os.environ.get("RBW_PROFILE"):
+    rbw_cache_dir = cache_home / f"rbw-{os.environ.get('RBW_PROFILE')}"
+else:
+    rbw_cache_dir = cache_home / "rbw"
 
 if os.environ.get("XDG_CONFIG_HOME"):
     config_home = Path(os.environ.get("XDG_CONFIG_HOME"))
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import JSONDecodeError
 from subprocess import run
 from typing import Any
@@ -10,9 +11,14 @@ from .models.entry import Entry
 from .models.EntryType import EntryType
 from .models.field import Field, FieldType
 from .models.note import Note
+from .paths import rbw_cache_dir
 
 
 class Rbw:
+    def __init__(self) -> None:
+        self.__prefetched: Future[dict[str, DetailedEntry]] | None = None
+        self.__prefetched_hashes: set[str] = set()
+
     def list_entries(self) -> list[Entry]:
         rbw = run(["rbw", "list", "--raw"], encoding="utf-8", capture_output=True)
 
@@ -32,7 +38,53 @@ class Rbw:
             key=lambda x: x.folder.lower() + x.name.lower(),
         )
 
+    def prefetch_credentials(self, entries: list[Entry]) -> None:
+        if not entries:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.__prefetched = executor.submit(self.__prefetch, entries)
+        self.__prefetched_hashes = {entry.hashed for entry in entries}
+        executor.shutdown(wait=False)
+
+    def __prefetch(self, entries: list[Entry]) -> dict[str, DetailedEntry]:
+        if not self.is_unlocked():
+            return {}
+
+        return {
+            entry.hashed: detailed_entry
+            for entry, detailed_entry in zip(entries, self.fetch_all_credentials(entries))
+            if detailed_entry is not None
+        }
+
+    def fetch_all_credentials(self, entries: list[Entry], workers: int = 8) -> list[DetailedEntry | None]:
+        fetched = []
+        if entries and not self.is_unlocked():
+            fetched.append(self.__try_fetch(entries[0]))
+            entries = entries[1:]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return fetched + list(executor.map(self.__try_fetch, entries))
+
     def fetch_credentials(self, entry: Entry) -> DetailedEntry:
+        if entry.hashed in self.__prefetched_hashes:
+            try:
+                prefetched = self.__prefetched.result()
+            except SystemExit:
+                prefetched = {}
+
+            if entry.hashed in prefetched:
+                return prefetched[entry.hashed]
+
+        return self.__fetch(entry)
+
+    def __try_fetch(self, entry: Entry) -> DetailedEntry | None:
+        try:
+            return self.__fetch(entry)
+        except SystemExit:
+            return None
+
+    def __fetch(self, entry: Entry) -> DetailedEntry:
         match entry.type:
             case EntryType.LOGIN.value:
                 return self.__fetch_login(entry)
@@ -56,6 +108,7 @@ class Rbw:
             data["data"]["totp"] is not None,
             data["notes"],
             [item["uri"] for item in data["data"]["uris"]],
+            totp_secret=data["data"]["totp"],
         )
 
     def __fetch_card(self, entry: Entry) -> Card:
@@ -101,5 +154,11 @@ class Rbw:
             print(f"Could not parse the output: {exception.msg}")
             exit(12)
 
-    def sync(self):
-        run(["rbw", "sync"])
+    def sync(self) -> bool:
+        return run(["rbw", "sync"], capture_output=True).returncode == 0
+
+    def is_unlocked(self) -> bool:
+        return run(["rbw", "unlocked"], capture_output=True).returncode == 0
+
+    def database_modified(self) -> float | None:
+        return max((database.stat().st_mtime for database in rbw_cache_dir.glob("*.json")), default=None)
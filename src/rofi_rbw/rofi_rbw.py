@@ -1,94 +1,228 @@
+import argparse
+import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import TypeVar
 
-from .argument_parsing import parse_arguments
+from .backend_cache import BackendCache
 from .cache import Cache
 from .clipboarder.clipboarder import Clipboarder
+from .daemon_client import DaemonClient
+from .domain_index import DomainIndex
 from .models.action import Action
 from .models.credentials import Credentials
 from .models.detailed_entry import DetailedEntry
+from .models.entry import Entry
+from .models.entry_diff import EntryDiff
 from .models.targets import Target, Targets, TypeTargets
 from .notifier import Notifier
 from .rbw import Rbw
+from .scheduler import Scheduler
+from .search_index import SearchIndex
 from .selector.selector import Selector
-from .typer.typer import Key, Typer
+from .snapshot import Snapshot
+from .typer.typer import Delay, Key, NoTyperFoundException, Typer
+
+T = TypeVar("T")
 
 
 class RofiRbw(object):
-    def __init__(self) -> None:
-        self.args = parse_arguments()
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
         self.rbw = Rbw()
-        self.selector = Selector.best_option(self.args.selector)
-        self.typer = Typer.best_option(self.args.typer)
-        self.clipboarder = Clipboarder.best_option(self.args.clipboarder)
-        self.notifer = Notifier()
-        self.active_window = self.typer.get_active_window()
+        self.daemon = DaemonClient()
+        self.backends = BackendCache()
+        self.selector = self.__resolve_backend("selector", self.args.selector, Selector.best_option)
+        self.__active_window: Future[tuple[str, str | None]] | None = None
+        self.__sync: Future[EntryDiff | None] | None = None
+
+    @cached_property
+    def typer(self) -> Typer:
+        return self.__resolve_backend("typer", self.args.typer, Typer.best_option)
+
+    @cached_property
+    def clipboarder(self) -> Clipboarder:
+        return self.__resolve_backend("clipboarder", self.args.clipboarder, Clipboarder.best_option)
+
+    @cached_property
+    def notifier(self) -> Notifier:
+        return Notifier()
+
+    @property
+    def active_window(self) -> str:
+        return self.__active_window.result()[0]
+
+    @property
+    def active_window_title(self) -> str | None:
+        try:
+            return self.__active_window.result()[1]
+        except NoTyperFoundException:
+            return None
 
     def main(self) -> None:
-        entries = self.rbw.list_entries()
-
-        if self.args.use_cache:
-            cache = Cache()
-            entries = cache.sorted(entries)
-
-        (selected_targets, selected_action, selected_entry) = self.selector.show_selection(
-            entries,
-            self.args.prompt,
-            self.args.show_help,
-            self.args.display_fields,
-            self.args.parsed_keybindings,
-            self.args.selector_args,
-        )
-
-        if selected_action == Action.SYNC:
-            self.rbw.sync()
+        startup = time.perf_counter()
+        cache = Cache(self.args.cache_half_life) if self.args.use_cache else None
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.__active_window = executor.submit(
+                self.__timed, "active window", lambda: self.typer.get_active_window_with_title()
+            )
+            listed_entries = executor.submit(self.__timed, "list entries", self.__list_entries)
+            if cache is not None:
+                executor.submit(self.__timed, "load cache", cache.load)
+
+        entries = listed_entries.result()
+
+        if cache is not None:
+            entries = self.__timed("sort entries", lambda: cache.sorted(entries))
+            self.rbw.prefetch_credentials(cache.most_used(entries, self.args.prefetch))
+
+        if self.active_window_title:
+            entries = self.__timed(
+                "rank by window title", lambda: DomainIndex(entries).ranked(entries, self.active_window_title)
+            )
+
+        if self.args.filter:
+            entries = self.__timed(
+                "filter entries", lambda: SearchIndex.for_entries(entries).search(self.args.filter, entries)
+            )
+
+        self.__log_timing("startup", startup)
+
+        self.selector.configure_target_menu(self.args.targets, self.args.parsed_menu_keybindings)
+
+        prompt = self.args.prompt
+        while True:
+            if self.__sync is not None and self.__sync.done():
+                entries, prompt = self.__apply_sync(entries, cache)
+            elif self.__sync is not None:
+                prompt = f"{self.args.prompt} (syncing…)"
+
             (selected_targets, selected_action, selected_entry) = self.selector.show_selection(
-                self.rbw.list_entries(),
-                self.args.prompt,
+                entries,
+                prompt,
                 self.args.show_help,
                 self.args.display_fields,
                 self.args.parsed_keybindings,
                 self.args.selector_args,
             )
 
-        if selected_action == Action.CANCEL:
+            if selected_action == Action.SYNC:
+                if self.__sync is None:
+                    self.__start_sync(entries)
+                continue
+
+            if selected_action == Action.CANCEL:
+                return
+
+            entry = self.rbw.fetch_credentials(selected_entry)
+
+            if cache is not None:
+                cache.update(selected_entry)
+
+            targets = selected_targets if selected_targets is not None else self.args.targets
+            action = selected_action if selected_action is not None else self.args.action
+
+            if targets is not None and Targets.MENU in targets:
+                targets, menu_action = self.selector.select_target(
+                    entry,
+                    self.args.show_help,
+                    self.args.parsed_menu_keybindings,
+                    additional_args=self.args.selector_args,
+                )
+                if menu_action == Action.CANCEL:
+                    continue
+                if menu_action is not None:
+                    action = menu_action
+
+            self.__execute_action(entry, targets, action)
             return
 
-        entry = self.rbw.fetch_credentials(selected_entry)
+    def __start_sync(self, entries: list[Entry]) -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.__sync = executor.submit(self.__synchronize, entries)
+        executor.shutdown(wait=False)
 
-        if self.args.use_cache:
-            cache.update(selected_entry)
+    def __synchronize(self, entries: list[Entry]) -> EntryDiff | None:
+        try:
+            if not self.rbw.sync():
+                diff = None
+            else:
+                self.daemon.invalidate()
+                synced_entries = self.rbw.list_entries()
+                if self.args.use_cache:
+                    Snapshot().save(synced_entries, self.rbw.database_modified())
+                diff = EntryDiff.between(entries, synced_entries)
+        except SystemExit:
+            diff = None
 
-        if selected_targets is not None:
-            self.args.targets = selected_targets
+        if self.args.use_notify_send:
+            self.notifier.notify("rbw sync failed" if diff is None else f"rbw sync finished: {diff}")
+        return diff
 
-        if selected_action is not None:
-            self.args.action = selected_action
+    def __apply_sync(self, entries: list[Entry], cache: Cache | None) -> tuple[list[Entry], str]:
+        diff = self.__sync.result()
+        self.__sync = None
+        if diff is None:
+            return entries, f"{self.args.prompt} (sync failed)"
 
-        if self.args.targets is not None and Targets.MENU in self.args.targets:
-            targets, action = self.__show_target_menu(
-                entry,
-                self.args.show_help,
-            )
-            self.args.targets = targets
-            if action is not None:
-                self.args.action = action
+        if diff:
+            entries = diff.apply(entries)
+            if cache is not None:
+                entries = cache.sorted(entries)
+        return entries, f"{self.args.prompt} (synced: {diff})"
+
+    def __resolve_backend(self, kind: str, name: str | None, best_option: Callable[[str | None], T]) -> T:
+        if name is not None:
+            return best_option(name)
+
+        try:
+            backend = best_option(self.backends.get(kind))
+        except StopIteration:
+            backend = best_option(None)
+        self.backends.set(kind, backend.name())
+        return backend
 
-        self.__execute_action(entry)
+    def __timed(self, stage: str, function: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return function()
+        finally:
+            self.__log_timing(stage, start)
 
-    def __show_target_menu(self, entry: DetailedEntry, show_help_message: bool) -> tuple[list[Target], Action | None]:
-        targets, action = self.selector.select_target(
-            entry, show_help_message, self.args.parsed_menu_keybindings, additional_args=self.args.selector_args
-        )
+    def __log_timing(self, stage: str, start: float) -> None:
+        if self.args.debug:
+            sys.stderr.write(f"{stage}: {(time.perf_counter() - start) * 1000:.1f} ms\n")
 
-        if action == Action.CANCEL:
-            self.main()
-            exit(0)
+    def __log_schedule(self, scheduler: Scheduler) -> None:
+        if self.args.debug:
+            for timing in scheduler.timings:
+                sys.stderr.write(
+                    f"{timing.step}: planned {timing.planned * 1000:.1f} ms, actual {timing.actual * 1000:.1f} ms\n"
+                )
 
-        return targets, action
+    def __list_entries(self) -> list[Entry]:
+        entries = self.daemon.list_entries()
+        if entries is not None:
+            return entries
 
-    def __execute_action(self, detailed_entry: DetailedEntry) -> None:
-        targets = self.__configure_targets(detailed_entry)
-        match self.args.action:
+        if not self.args.use_cache:
+            return self.rbw.list_entries()
+
+        snapshot = Snapshot()
+        database_modified = self.rbw.database_modified()
+        entries = snapshot.load(database_modified)
+        if entries is None:
+            entries = self.rbw.list_entries()
+            snapshot.save(entries, database_modified)
+
+        return entries
+
+    def __execute_action(self, detailed_entry: DetailedEntry, targets: list[Target] | None, action: Action) -> None:
+        targets = self.__configure_targets(detailed_entry, targets, action)
+        match action:
             case Action.TYPE:
                 self.__type_targets(detailed_entry, targets)
             case Action.COPY:
@@ -96,37 +230,58 @@ class RofiRbw(object):
             case Action.PRINT:
                 print("\n".join([detailed_entry[target] for target in targets]))
 
-    def __configure_targets(self, detailed_entry: DetailedEntry) -> list[Target]:
-        if self.args.targets:
-            return self.args.targets
+    def __configure_targets(
+        self, detailed_entry: DetailedEntry, targets: list[Target] | None, action: Action
+    ) -> list[Target]:
+        if targets:
+            return targets
 
-        if self.args.action == Action.TYPE:
+        if action == Action.TYPE:
             return detailed_entry.autotype_sequence or detailed_entry.default_autotype_target
 
         return detailed_entry.default_target
 
     def __type_targets(self, detailed_entry: DetailedEntry, targets: list[Target]):
+        sequence = []
         for target in targets:
             match target:
                 case TypeTargets.DELAY:
-                    time.sleep(self.args.action_sequence_delay / 1000)
+                    sequence.append(Delay(self.args.action_sequence_delay))
                 case TypeTargets.ENTER:
-                    self.typer.press_key(Key.ENTER)
+                    sequence.append(Key.ENTER)
                 case TypeTargets.TAB:
-                    self.typer.press_key(Key.TAB)
+                    sequence.append(Key.TAB)
                 case _:
-                    self.typer.type_characters(
-                        detailed_entry[target], self.args.start_delay, self.args.key_delay, self.active_window
-                    )
-        if Targets.PASSWORD in targets and isinstance(detailed_entry, Credentials) and detailed_entry.totp != "":
-            self.clipboarder.copy_to_clipboard(detailed_entry.totp)
+                    value = detailed_entry[target]
+                    if value:
+                        sequence.append(value)
+
+        scheduler = Scheduler(self.args.start_delay, self.args.key_delay)
+        try:
+            self.typer.type_sequence(sequence, scheduler, self.active_window)
+        finally:
+            self.typer.close()
+            self.__log_schedule(scheduler)
+        if Targets.PASSWORD in targets and isinstance(detailed_entry, Credentials) and detailed_entry.has_totp:
+            totp = detailed_entry.totp
+            if totp == "":
+                return
+
+            self.clipboarder.copy_to_clipboard(totp)
             if self.args.use_notify_send:
-                self.notifer.notify("totp copied to clipboard")
+                if detailed_entry.totp_validity is not None:
+                    self.notifier.notify(f"totp copied to clipboard, valid for {detailed_entry.totp_validity} s")
+                else:
+                    self.notifier.notify("totp copied to clipboard")
 
     def __copy_targets(self, detailed_entry: DetailedEntry, targets: list[Target]):
+        if self.args.clipboard_queue and self.__queue_targets(detailed_entry, targets):
+            return
+
+        scheduler = Scheduler()
         for target in targets:
             if target == TypeTargets.DELAY:
-                time.sleep(self.args.action_sequence_delay / 1000)
+                scheduler.wait(self.args.action_sequence_delay)
             else:
                 value = detailed_entry[target]
                 if not value:
@@ -134,7 +289,19 @@ class RofiRbw(object):
                 self.clipboarder.copy_to_clipboard(value)
 
                 if self.args.use_notify_send:
-                    self.notifer.notify(f"{target.raw} copied to clipboard")
+                    self.notifier.notify(f"{target.raw} copied to clipboard")
 
         if len(targets) == 1 and targets[0] == Targets.PASSWORD:
             self.clipboarder.clear_clipboard_after(self.args.clear)
+
+    def __queue_targets(self, detailed_entry: DetailedEntry, targets: list[Target]) -> bool:
+        queued_targets = [target for target in targets if target != TypeTargets.DELAY and detailed_entry[target]]
+        if len(queued_targets) < 2:
+            return False
+
+        if not self.clipboarder.copy_queue([detailed_entry[target] for target in queued_targets], self.args.clear):
+            return False
+
+        if self.args.use_notify_send:
+            self.notifier.notify(f"{', '.join(target.raw for target in queued_targets)} queued in clipboard")
+        return True
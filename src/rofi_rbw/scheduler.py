@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from time import monotonic, sleep
+
+
+@dataclass(frozen=True)
+class Timing:
+    step: str
+    planned: float
+    actual: float
+
+
+class Scheduler:
+    def __init__(self, start_delay: int = 0, key_delay: int = 0) -> None:
+        self.start_delay = start_delay
+        self.key_delay = key_delay
+        self.timings: list[Timing] = []
+        self.__begin = monotonic()
+        self.__last_step = self.__begin
+        self.__planned = 0.0
+
+    def start(self) -> None:
+        self.__begin = monotonic()
+        self.__last_step = self.__begin
+        self.__planned = self.start_delay / 1000
+        self.__sleep_until(self.__begin + self.start_delay / 1000)
+        self.__record("start delay")
+
+    def wait(self, milliseconds: int) -> None:
+        self.__planned += milliseconds / 1000
+        self.__sleep_until(self.__last_step + milliseconds / 1000)
+        self.__record(f"delay {milliseconds} ms")
+
+    def typed(self, keys: int, delays: int = 0) -> None:
+        self.__planned += (keys * self.key_delay + delays) / 1000
+        self.__record(f"type {keys} keys")
+
+    def __sleep_until(self, deadline: float) -> None:
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+
+    def __record(self, step: str) -> None:
+        self.__last_step = monotonic()
+        self.timings.append(Timing(step, self.__planned, self.__last_step - self.__begin))
@@ -0,0 +1,140 @@
+import json
+import math
+from collections import Counter
+from hashlib import sha1
+from json import JSONDecodeError
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from .models.entry import Entry
+from .paths import search_index_file
+
+NGRAM = 3
+MINIMUM_MATCH = 0.5
+
+
+class SearchIndex:
+    def __init__(self, entries: list[Entry], postings: dict[str, set[int]] | None = None):
+        self.entries = entries
+        self.postings = postings if postings is not None else self.__build(entries)
+        self.haystacks: list[str] | None = None
+
+    @staticmethod
+    def for_entries(entries: list[Entry]) -> "SearchIndex":
+        key = SearchIndex.__key(entries)
+        index = SearchIndex.__load(entries, key)
+        if index is None:
+            index = SearchIndex(entries)
+            index.__save(key)
+
+        return index
+
+    def search(self, query: str, order: list[Entry] | None = None) -> list[Entry]:
+        scores = self.__score(query.lower().strip())
+        if order is None:
+            ranked = sorted(sorted(scores), key=scores.__getitem__, reverse=True)
+            return [self.entries[position] for position in ranked]
+
+        scores_by_hash = {self.entries[position].hashed: score for position, score in scores.items()}
+        return sorted(
+            [entry for entry in order if entry.hashed in scores_by_hash],
+            key=lambda entry: scores_by_hash[entry.hashed],
+            reverse=True,
+        )
+
+    def __score(self, query: str) -> dict[int, float]:
+        if not query:
+            return dict.fromkeys(range(len(self.entries)), 1)
+
+        ngrams = self.__ngrams(query)
+        if not ngrams:
+            return self.__score_substring(query)
+
+        postings = sorted((self.postings.get(ngram, set()) for ngram in ngrams), key=len)
+        exact = set.intersection(*postings)
+        minimum = math.ceil(len(ngrams) * MINIMUM_MATCH)
+        candidates = set().union(*postings[: len(ngrams) - minimum + 1]) - exact
+
+        counts = Counter()
+        for posting in postings:
+            counts.update(candidates & posting)
+
+        scores = dict.fromkeys(exact, 1)
+        scores.update((position, count / len(ngrams)) for position, count in counts.items() if count >= minimum)
+        return scores
+
+    def __score_substring(self, query: str) -> dict[int, float]:
+        if self.haystacks is None:
+            self.haystacks = [self.__haystack(entry) for entry in self.entries]
+
+        return {position: 1 for position, haystack in enumerate(self.haystacks) if query in haystack}
+
+    @staticmethod
+    def __build(entries: list[Entry]) -> dict[str, set[int]]:
+        postings = {}
+        for position, entry in enumerate(entries):
+            for ngram in SearchIndex.__ngrams(SearchIndex.__haystack(entry)):
+                postings.setdefault(ngram, set()).add(position)
+        return postings
+
+    @staticmethod
+    def __haystack(entry: Entry) -> str:
+        uris = [uri.split("://", 1)[-1] for uri in entry.uris]
+        return "\n".join([entry.name, entry.folder or "", entry.username or "", *uris]).lower()
+
+    @staticmethod
+    def __ngrams(text: str) -> set[str]:
+        return {
+            ngram for part in text.split("\n") for ngram in (part[i : i + NGRAM] for i in range(len(part) - NGRAM + 1))
+        }
+
+    @staticmethod
+    def __key(entries: list[Entry]) -> str:
+        m = sha1()
+        for hashed in sorted(entry.hashed for entry in entries):
+            m.update(hashed.encode())
+        return m.hexdigest()
+
+    @staticmethod
+    def __load(entries: list[Entry], key: str) -> "SearchIndex | None":
+        try:
+            with search_index_file.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, JSONDecodeError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+
+        entries_by_hash = {entry.hashed: entry for entry in entries}
+        if len(entries_by_hash) != len(entries):
+            return None
+
+        try:
+            indexed_entries = [entries_by_hash[hashed] for hashed in data["hashes"]]
+            postings = {ngram: set(positions) for ngram, positions in data["postings"].items()}
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+        return SearchIndex(indexed_entries, postings)
+
+    def __save(self, key: str) -> None:
+        temporary_file = None
+        try:
+            search_index_file.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=search_index_file.parent, prefix=f"{search_index_file.name}.", encoding="utf-8", delete=False
+            ) as f:
+                temporary_file = Path(f.name)
+                json.dump(
+                    {
+                        "key": key,
+                        "hashes": [entry.hashed for entry in self.entries],
+                        "postings": {ngram: sorted(positions) for ngram, positions in self.postings.items()},
+                    },
+                    f,
+                )
+            temporary_file.replace(search_index_file)
+        except OSError:
+            if temporary_file is not None:
+                temporary_file.unlink(missing_ok=True)
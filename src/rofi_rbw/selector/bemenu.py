@@ -30,14 +30,9 @@ class Bemenu(Selector):
     ) -> tuple[None, Action | None, Entry | None]:
         parameters = ["bemenu", "-p", prompt, *additional_args]
 
-        bemenu = run(
-            parameters,
-            input="\n".join(self._format_entries(entries, display_fields)),
-            capture_output=True,
-            encoding="utf-8",
-        )
+        bemenu = self._run_with_lines(parameters, self._generate_entries(entries, display_fields))
         if bemenu.returncode == 0:
-            return None, None, self._find_entry(entries, bemenu.stdout, display_fields)
+            return None, None, self._find_entry(bemenu.stdout)
         else:
             return None, Action.CANCEL, None
 
@@ -41,12 +41,7 @@ class Fuzzel(Selector):
         if show_help_message and keybindings:
             parameters.extend(self.__format_keybindings_message(keybindings))
 
-        fuzzel = run(
-            parameters,
-            input="\n".join(self._format_entries(entries, display_fields)),
-            capture_output=True,
-            encoding="utf-8",
-        )
+        fuzzel = self._run_with_lines(parameters, self._generate_entries(entries, display_fields))
 
         if fuzzel.returncode == 1:
             return None, Action.CANCEL, None
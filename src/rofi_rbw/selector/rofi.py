@@ -11,6 +11,9 @@ from .selector import Selector
 
 
 class Rofi(Selector):
+    def __init__(self) -> None:
+        self.__previous_selection: tuple[int, str] | None = None
+
     @staticmethod
     def supported() -> bool:
         return is_installed("rofi")
@@ -33,7 +36,7 @@ class Rofi(Selector):
             "-markup-rows",
             "-dmenu",
             "-format",
-            "i",
+            "i f",
             "-i",
             "-sort",
             "-p",
@@ -42,15 +45,16 @@ class Rofi(Selector):
             *additional_args,
         ]
 
+        if self.__previous_selection is not None:
+            row, filter_text = self.__previous_selection
+            parameters.extend(["-selected-row", str(row)])
+            if filter_text:
+                parameters.extend(["-filter", filter_text])
+
         if show_help_message and keybindings:
             parameters.extend(self.__format_keybindings_message(keybindings))
 
-        rofi = run(
-            parameters,
-            input="\n".join(self._format_entries(entries, display_fields)),
-            capture_output=True,
-            encoding="utf-8",
-        )
+        rofi = self._run_with_lines(parameters, self._generate_entries(entries, display_fields))
 
         if rofi.returncode == 1:
             return None, Action.CANCEL, None
@@ -62,7 +66,10 @@ class Rofi(Selector):
             return_action = None
             return_targets = None
 
-        return return_targets, return_action, (entries[int(rofi.stdout.strip())])
+        index, _, filter_text = rofi.stdout.rstrip("\n").partition(" ")
+        self.__previous_selection = (int(index), filter_text)
+
+        return return_targets, return_action, entries[int(index)]
 
     def _format_field(self, entry: Entry, token: DisplayFieldToken) -> str:
         match token:
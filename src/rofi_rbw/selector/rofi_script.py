@@ -0,0 +1,252 @@
+import json
+import os
+import shlex
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from subprocess import run
+from tempfile import TemporaryDirectory
+from typing import Any, TextIO
+
+from ..models.action import Action
+from ..models.display_field_token import DisplayFieldToken
+from ..models.entry import Entry
+from ..models.keybinding import Keybinding
+from ..models.targets import Target, Targets, TypeTarget
+from .rofi import Rofi
+
+BACK = "back"
+
+
+class RofiScript(Rofi):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__menu_targets: list[Target] | None = None
+        self.__menu_keybindings: list[Keybinding] = []
+
+    @staticmethod
+    def name() -> str:
+        return "rofi-script"
+
+    def show_selection(
+        self,
+        entries: list[Entry],
+        prompt: str,
+        show_help_message: bool,
+        display_fields: list[DisplayFieldToken],
+        keybindings: list[Keybinding],
+        additional_args: list[str],
+    ) -> tuple[list[Target] | None, Action | None, Entry | None]:
+        shortcuts = list(dict.fromkeys(keybinding.shortcut for keybinding in keybindings + self.__menu_keybindings))
+
+        with TemporaryDirectory(prefix="rofi-rbw-") as directory:
+            state_directory = Path(directory)
+            (state_directory / "state.json").write_text(
+                json.dumps(
+                    {
+                        "prompt": prompt,
+                        "show_help_message": show_help_message,
+                        "entries": [asdict(entry) for entry in entries],
+                        "lines": self._format_entries(entries, display_fields),
+                        "shortcuts": shortcuts,
+                        "keybindings": [self.__serialize_keybinding(keybinding) for keybinding in keybindings],
+                        "menu_keybindings": [
+                            self.__serialize_keybinding(keybinding) for keybinding in self.__menu_keybindings
+                        ],
+                        "targets": [target.raw for target in self.__menu_targets] if self.__menu_targets else None,
+                    }
+                )
+            )
+
+            parameters = [
+                "rofi",
+                "-show",
+                "rbw",
+                "-modi",
+                f"rbw:{shlex.quote(sys.executable)} -m rofi_rbw.selector.rofi_script",
+                "-i",
+                "-sort",
+            ]
+            for index, shortcut in enumerate(shortcuts):
+                parameters.extend([f"-kb-custom-{1 + index}", shortcut])
+
+            run([*parameters, *additional_args], env={**os.environ, "ROFI_RBW_STATE": directory})
+
+            result_file = state_directory / "result.json"
+            if not result_file.exists():
+                return None, Action.CANCEL, None
+            result = json.loads(result_file.read_text())
+
+        action = Action(result["action"]) if result["action"] else None
+        entry = entries[result["entry"]] if result["entry"] is not None else None
+        if result["targets"] is None:
+            return None, action, entry
+
+        return [TypeTarget(target) for target in result["targets"]], action, entry
+
+    def configure_target_menu(self, targets: list[Target] | None, keybindings: list[Keybinding]) -> None:
+        self.__menu_targets = targets
+        self.__menu_keybindings = keybindings
+
+    def callback(self, state_directory: Path, retv: int, data: str, info: str, output: TextIO, text: str = "") -> None:
+        state = json.loads((state_directory / "state.json").read_text())
+        view, *arguments = data.split(" ") if data else ["entries"]
+
+        if view == "entries":
+            self.__handle_entries(state_directory, state, retv, info, text, output)
+        else:
+            self.__handle_targets(state_directory, state, retv, info, int(arguments[0]), arguments[1:], output)
+
+    def __handle_entries(
+        self, state_directory: Path, state: dict[str, Any], retv: int, info: str, text: str, output: TextIO
+    ) -> None:
+        if retv == 2 and text:
+            self.__show_search_results(state, text, output)
+            return
+
+        if retv == 1 and info:
+            if state["targets"] and Targets.MENU.raw in state["targets"]:
+                self.__show_targets(state, int(info), None, output)
+            else:
+                self.__finish(state_directory, int(info), None, None)
+            return
+
+        keybinding = self.__keybinding(state, state["keybindings"], retv)
+        if keybinding is None or not info:
+            self.__show_entries(state, output)
+        elif keybinding["action"] == Action.SYNC.value:
+            self.__finish(state_directory, None, Action.SYNC.value, None)
+        elif keybinding["targets"] and Targets.MENU.raw in keybinding["targets"]:
+            self.__show_targets(state, int(info), keybinding["action"], output)
+        else:
+            self.__finish(state_directory, int(info), keybinding["action"], keybinding["targets"])
+
+    def __handle_targets(
+        self,
+        state_directory: Path,
+        state: dict[str, Any],
+        retv: int,
+        info: str,
+        entry_index: int,
+        action: list[str],
+        output: TextIO,
+    ) -> None:
+        if info == BACK:
+            self.__show_entries(state, output, entry_index)
+            return
+
+        keybinding = self.__keybinding(state, state["menu_keybindings"], retv)
+        if retv == 1 and info:
+            selected_action = action[0] if action else None
+        elif keybinding is not None and info:
+            selected_action = keybinding["action"]
+        else:
+            self.__show_targets(state, entry_index, action[0] if action else None, output)
+            return
+
+        self.__finish(
+            state_directory, entry_index, selected_action, [target.raw for target in self._extract_targets(info)]
+        )
+
+    def __show_entries(
+        self,
+        state: dict[str, Any],
+        output: TextIO,
+        selected_row: int | None = None,
+        lines: list[tuple[int, str]] | None = None,
+    ) -> None:
+        self.__write_option(output, "prompt", state["prompt"])
+        self.__write_option(output, "markup-rows", "true")
+        self.__write_option(output, "use-hot-keys", "true")
+        self.__write_option(output, "data", "entries")
+        if selected_row is not None:
+            self.__write_option(output, "new-selection", str(selected_row))
+        if state["show_help_message"] and state["keybindings"]:
+            self.__write_option(output, "message", self.__format_help(state["keybindings"]))
+
+        for index, line in lines if lines is not None else enumerate(state["lines"]):
+            output.write(f"{line}\0info\x1f{index}\n")
+
+    def __show_search_results(self, state: dict[str, Any], text: str, output: TextIO) -> None:
+        from ..search_index import SearchIndex
+
+        entries = [Entry(**entry) for entry in state["entries"]]
+        positions = {entry.hashed: position for position, entry in enumerate(entries)}
+        results = SearchIndex.for_entries(entries).search(text, entries)
+
+        self.__show_entries(
+            state,
+            output,
+            lines=[(positions[entry.hashed], state["lines"][positions[entry.hashed]]) for entry in results],
+        )
+
+    def __show_targets(self, state: dict[str, Any], entry_index: int, action: str | None, output: TextIO) -> None:
+        from ..rbw import Rbw
+
+        entry = Rbw().fetch_credentials(Entry(**state["entries"][entry_index]))
+
+        self.__write_option(output, "prompt", "Choose target")
+        self.__write_option(output, "markup-rows", "true")
+        self.__write_option(output, "use-hot-keys", "true")
+        self.__write_option(output, "data", f"targets {entry_index} {action or ''}".strip())
+        if state["show_help_message"] and state["menu_keybindings"]:
+            self.__write_option(output, "message", self.__format_help(state["menu_keybindings"]))
+
+        for line in self._format_targets_from_entry(entry):
+            line = line.replace("\n", " ")
+            output.write(f"{line}\0info\x1f{line}\n")
+        output.write(f"« Back\0info\x1f{BACK}\n")
+
+    def __finish(
+        self, state_directory: Path, entry_index: int | None, action: str | None, targets: list[str] | None
+    ) -> None:
+        (state_directory / "result.json").write_text(
+            json.dumps({"entry": entry_index, "action": action, "targets": targets})
+        )
+
+    def __keybinding(
+        self, state: dict[str, Any], keybindings: list[dict[str, Any]], retv: int
+    ) -> dict[str, Any] | None:
+        if not 10 <= retv < 10 + len(state["shortcuts"]):
+            return None
+
+        shortcut = state["shortcuts"][retv - 10]
+        return next((keybinding for keybinding in keybindings if keybinding["shortcut"] == shortcut), None)
+
+    def __format_help(self, keybindings: list[dict[str, Any]]) -> str:
+        return " | ".join(
+            f"<b>{keybinding['shortcut']}</b>: {self._format_action_and_targets(self.__deserialize_keybinding(keybinding))}"
+            for keybinding in keybindings
+        )
+
+    def __write_option(self, output: TextIO, option: str, value: str) -> None:
+        output.write(f"\0{option}\x1f{value}\n")
+
+    def __serialize_keybinding(self, keybinding: Keybinding) -> dict[str, Any]:
+        return {
+            "shortcut": keybinding.shortcut,
+            "action": keybinding.action.value if keybinding.action else None,
+            "targets": [target.raw for target in keybinding.targets] if keybinding.targets is not None else None,
+        }
+
+    def __deserialize_keybinding(self, keybinding: dict[str, Any]) -> Keybinding:
+        return Keybinding(
+            keybinding["shortcut"],
+            Action(keybinding["action"]) if keybinding["action"] else None,
+            [TypeTarget(target) for target in keybinding["targets"]] if keybinding["targets"] is not None else None,
+        )
+
+
+def main() -> None:
+    RofiScript().callback(
+        Path(os.environ["ROFI_RBW_STATE"]),
+        int(os.environ.get("ROFI_RETV", "0")),
+        os.environ.get("ROFI_DATA", ""),
+        os.environ.get("ROFI_INFO", ""),
+        sys.stdout,
+        sys.argv[1] if len(sys.argv) > 1 else "",
+    )
+
+
+if __name__ == "__main__":
+    main()
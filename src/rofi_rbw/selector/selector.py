@@ -1,5 +1,7 @@
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from subprocess import DEVNULL, PIPE, CompletedProcess, Popen
 
 from ..models.action import Action
 from ..models.card import Card
@@ -11,16 +13,22 @@ from ..models.keybinding import Keybinding
 from ..models.note import Note
 from ..models.targets import Target, Targets
 
+ZERO_WIDTH_SPACE = "\u200b"
+
 
 class Selector(ABC):
+    _entries_by_line: dict[str, Entry]
+    _formatted_entries: tuple[list[Entry], list[DisplayFieldToken], list[str]] | None = None
+
     @staticmethod
     def best_option(name: str | None = None) -> "Selector":
         from .bemenu import Bemenu
         from .fuzzel import Fuzzel
         from .rofi import Rofi
+        from .rofi_script import RofiScript
         from .wofi import Wofi
 
-        available_selectors = [Rofi, Wofi, Fuzzel, Bemenu]
+        available_selectors = [Rofi, RofiScript, Wofi, Fuzzel, Bemenu]
 
         if name is not None:
             try:
@@ -65,29 +73,52 @@ class Selector(ABC):
     ) -> tuple[list[Target] | None, Action | None]:
         pass
 
+    def configure_target_menu(self, targets: list[Target] | None, keybindings: list[Keybinding]) -> None:
+        pass
+
     def _format_entries(self, entries: list[Entry], display_fields: list[DisplayFieldToken]) -> list[str]:
+        return list(self._generate_entries(entries, display_fields))
+
+    def _generate_entries(self, entries: list[Entry], display_fields: list[DisplayFieldToken]) -> Iterator[str]:
+        if self._formatted_entries is not None:
+            formatted_for, formatted_fields, lines = self._formatted_entries
+            if formatted_for is entries and formatted_fields == display_fields:
+                yield from lines
+                return
+
+        lines = []
         number_tokens = len(display_fields)
         formatted_entries = [[self._format_field(entry, token) for token in display_fields] for entry in entries]
         max_lengths = [max(len(field) for field in pivoted_fields) for pivoted_fields in zip(*formatted_entries)]
 
-        return [
-            "  ".join([entry[field_index].ljust(max_lengths[field_index]) for field_index in range(number_tokens)])
-            for entry in formatted_entries
-        ]
-
-    def _find_entry(
-        self, entries: list[Entry], formatted_string: str, display_fields: list[DisplayFieldToken]
-    ) -> Entry:
-        pattern = f"^{' {2,}'.join(f'(?P<{token.name.lower()}>.*?)' for token in display_fields)}$"
-        match = re.compile(pattern).search(formatted_string)
-
-        return next(
-            entry
-            for entry in entries
-            if all(
-                self._format_field(entry, token) == match.group(token.name.lower()).strip() for token in display_fields
+        self._entries_by_line = {}
+        for entry, formatted_entry in zip(entries, formatted_entries):
+            line = "  ".join(
+                [formatted_entry[field_index].ljust(max_lengths[field_index]) for field_index in range(number_tokens)]
             )
-        )
+            while line.strip() in self._entries_by_line:
+                line += ZERO_WIDTH_SPACE
+            self._entries_by_line[line.strip()] = entry
+
+            lines.append(line)
+            yield line
+
+        self._formatted_entries = (entries, display_fields, lines)
+
+    def _run_with_lines(self, parameters: list[str], lines: Iterable[str]) -> CompletedProcess:
+        process = Popen(parameters, stdin=PIPE, stdout=PIPE, stderr=DEVNULL, encoding="utf-8")
+
+        try:
+            for line in lines:
+                process.stdin.write(f"{line}\n")
+        except BrokenPipeError:
+            pass
+
+        stdout, _ = process.communicate()
+        return CompletedProcess(parameters, process.returncode, stdout)
+
+    def _find_entry(self, formatted_string: str) -> Entry:
+        return self._entries_by_line[formatted_string.strip()]
 
     def _format_targets_from_entry(self, entry: DetailedEntry) -> list[str]:
         match entry:
@@ -107,7 +138,10 @@ class Selector(ABC):
         if credentials.password:
             targets.append(f"Password: {credentials.password[0]}{'*' * (len(credentials.password) - 1)}")
         if credentials.has_totp:
-            targets.append(f"TOTP: {credentials.totp}")
+            if credentials.totp_validity is not None:
+                targets.append(f"TOTP: {credentials.totp} (valid for {credentials.totp_validity} s)")
+            else:
+                targets.append(f"TOTP: {credentials.totp}")
         if credentials.notes:
             targets.append(f"Notes: {credentials.notes}")
         if len(credentials.uris) == 1:
@@ -30,14 +30,9 @@ class Wofi(Selector):
     ) -> tuple[None, Action | None, Entry | None]:
         parameters = ["wofi", "--dmenu", "-p", prompt, *additional_args]
 
-        wofi = run(
-            parameters,
-            input="\n".join(self._format_entries(entries, display_fields)),
-            capture_output=True,
-            encoding="utf-8",
-        )
+        wofi = self._run_with_lines(parameters, self._generate_entries(entries, display_fields))
         if wofi.returncode == 0:
-            return None, None, self._find_entry(entries, wofi.stdout, display_fields)
+            return None, None, self._find_entry(wofi.stdout)
         else:
             return None, Action.CANCEL, None
 
@@ -0,0 +1,42 @@
+import json
+from dataclasses import asdict
+from json import JSONDecodeError
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from .models.entry import Entry
+from .paths import snapshot_file
+
+
+class Snapshot:
+    def load(self, database_modified: float | None) -> list[Entry] | None:
+        if database_modified is None or not snapshot_file.exists():
+            return None
+
+        try:
+            with snapshot_file.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, JSONDecodeError):
+            return None
+
+        if data.get("database_modified") != database_modified:
+            return None
+
+        return [Entry(**item) for item in data["entries"]]
+
+    def save(self, entries: list[Entry], database_modified: float | None) -> None:
+        if database_modified is None:
+            return
+
+        temporary_file = None
+        try:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=snapshot_file.parent, prefix=f"{snapshot_file.name}.", encoding="utf-8", delete=False
+            ) as f:
+                temporary_file = Path(f.name)
+                json.dump({"database_modified": database_modified, "entries": [asdict(entry) for entry in entries]}, f)
+            temporary_file.replace(snapshot_file)
+        except OSError:
+            if temporary_file is not None:
+                temporary_file.unlink(missing_ok=True)
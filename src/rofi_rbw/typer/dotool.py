@@ -1,11 +1,18 @@
-from subprocess import run
-from time import sleep
+import os
+import stat
+from subprocess import PIPE, Popen
+from typing import TextIO
 
 from ..abstractionhelper import is_installed
-from .typer import Key, Typer
+from ..scheduler import Scheduler
+from .typer import Delay, Key, Typer
 
 
 class DotoolTyper(Typer):
+    def __init__(self) -> None:
+        self.__connection: TextIO | None = None
+        self.__process: Popen | None = None
+
     @staticmethod
     def supported() -> bool:
         return is_installed("dotool")
@@ -17,11 +24,71 @@ class DotoolTyper(Typer):
     def get_active_window(self) -> str:
         return "not possible with dotool"
 
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
-        sleep(start_delay)
-        run(["dotool"], input=f"typedelay {key_delay}\ntype {characters}", encoding="utf-8")
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
+        self.type_sequence([characters], Scheduler(start_delay, key_delay), active_window)
 
     def press_key(self, key: Key) -> None:
+        self.__send(self.__command_for_key(key))
+
+    def type_sequence(self, sequence: list[str | Key | Delay], scheduler: Scheduler, active_window: str) -> None:
+        scheduler.start()
+        commands = [f"typedelay {scheduler.key_delay}\n"]
+        keys = 0
+        for step in sequence:
+            match step:
+                case Delay():
+                    self.__send("".join(commands))
+                    scheduler.typed(keys)
+                    commands = []
+                    keys = 0
+                    scheduler.wait(step.milliseconds)
+                case Key():
+                    commands.append(self.__command_for_key(step))
+                    keys += 1
+                case _:
+                    keys += len(step)
+                    for index, line in enumerate(step.split("\n")):
+                        if index > 0:
+                            commands.append(self.__command_for_key(Key.ENTER))
+                        if line:
+                            commands.append(f"type {line}\n")
+
+        self.__send("".join(commands))
+        scheduler.typed(keys)
+
+    def close(self) -> None:
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+        if self.__process is not None:
+            self.__process.wait()
+            self.__process = None
+
+    def __send(self, commands: str) -> None:
+        if not commands:
+            return
+
+        if self.__connection is None:
+            self.__connection = self.__connect()
+
+        self.__connection.write(commands)
+        self.__connection.flush()
+
+    def __connect(self) -> TextIO:
+        pipe = os.environ.get("DOTOOL_PIPE", "/tmp/dotool-pipe")
+        try:
+            if stat.S_ISFIFO(os.stat(pipe).st_mode):
+                descriptor = os.open(pipe, os.O_WRONLY | os.O_NONBLOCK)
+                os.set_blocking(descriptor, True)
+                return os.fdopen(descriptor, "w", encoding="utf-8")
+        except OSError:
+            pass
+
+        self.__process = Popen(["dotool"], stdin=PIPE, encoding="utf-8")
+        return self.__process.stdin
+
+    def __command_for_key(self, key: Key) -> str:
         match key:
             case Key.ENTER:
                 key_name = "enter"
@@ -30,4 +97,4 @@ class DotoolTyper(Typer):
             case _:
                 raise Exception("Unknown key")
 
-        run(["dotool"], input=f"key {key_name}", encoding="utf-8")
+        return f"key {key_name}\n"
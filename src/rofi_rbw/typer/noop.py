@@ -13,7 +13,7 @@ class NoopTyper(Typer):
     def get_active_window(self) -> str:
         raise NoTyperFoundException()
 
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
         raise NoTyperFoundException()
 
     def press_key(self, key: Key) -> None:
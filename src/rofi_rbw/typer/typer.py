@@ -1,5 +1,9 @@
 import enum
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ..scheduler import Scheduler
 
 
 class Typer(ABC):
@@ -32,14 +36,56 @@ class Typer(ABC):
     def get_active_window(self) -> str:
         pass
 
+    def get_active_window_with_title(self) -> tuple[str, str | None]:
+        return self.get_active_window(), None
+
     @abstractmethod
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
         pass
 
     @abstractmethod
     def press_key(self, key: "Key") -> None:
         pass
 
+    def type_sequence(self, sequence: list["str | Key | Delay"], scheduler: Scheduler, active_window: str) -> None:
+        scheduler.start()
+        for segment in self._segments(sequence):
+            if isinstance(segment, Delay):
+                scheduler.wait(segment.milliseconds)
+            else:
+                self._type_segment(segment, scheduler.key_delay, active_window)
+                scheduler.typed(self._key_count(segment))
+
+    def close(self) -> None:
+        pass
+
+    def _type_segment(self, segment: list["str | Key"], key_delay: int, active_window: str) -> None:
+        for step in segment:
+            if isinstance(step, Key):
+                self.press_key(step)
+            else:
+                self.type_characters(step, 0, key_delay, active_window)
+
+    def _segments(self, sequence: list["str | Key | Delay"]) -> Iterator["list[str | Key] | Delay"]:
+        segment = []
+        for step in sequence:
+            if isinstance(step, Delay):
+                if segment:
+                    yield segment
+                segment = []
+                yield step
+            else:
+                segment.append(step)
+
+        if segment:
+            yield segment
+
+    def _key_count(self, segment: list["str | Key | Delay"]) -> int:
+        return sum(len(step) if isinstance(step, str) else 1 for step in segment if not isinstance(step, Delay))
+
+    def _as_text(self, segment: list["str | Key"]) -> str:
+        return "".join(KEY_CHARACTERS[step] if isinstance(step, Key) else step for step in segment)
+
 
 class NoTyperFoundException(Exception):
     def __str__(self) -> str:
@@ -49,3 +95,11 @@ class NoTyperFoundException(Exception):
 class Key(enum.Enum):
     ENTER = "enter"
     TAB = "tab"
+
+
+KEY_CHARACTERS = {Key.ENTER: "\n", Key.TAB: "\t"}
+
+
+@dataclass(frozen=True)
+class Delay:
+    milliseconds: int
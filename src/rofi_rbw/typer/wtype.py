@@ -2,7 +2,8 @@ from subprocess import run
 from time import sleep
 
 from ..abstractionhelper import is_installed, is_wayland
-from .typer import Key, Typer
+from ..scheduler import Scheduler
+from .typer import Delay, Key, Typer
 
 
 class WTypeTyper(Typer):
@@ -17,8 +18,8 @@ class WTypeTyper(Typer):
     def get_active_window(self) -> str:
         return "not possible with wtype"
 
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
-        sleep(start_delay)
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
+        sleep(start_delay / 1000)
         args = ["wtype"]
 
         if key_delay > 0:
@@ -29,12 +30,38 @@ class WTypeTyper(Typer):
         run(args)
 
     def press_key(self, key: Key) -> None:
+        run(["wtype", "-k", self.__key_name(key)])
+
+    def type_sequence(self, sequence: list[str | Key | Delay], scheduler: Scheduler, active_window: str) -> None:
+        if any(isinstance(step, str) and step.startswith("-") for step in sequence):
+            super().type_sequence(sequence, scheduler, active_window)
+            return
+
+        scheduler.start()
+        args = ["wtype"]
+
+        if scheduler.key_delay > 0:
+            args = args + ["-d", str(scheduler.key_delay)]
+
+        for step in sequence:
+            match step:
+                case Delay():
+                    args.extend(["-s", str(step.milliseconds)])
+                case Key():
+                    args.extend(["-k", self.__key_name(step)])
+                case _:
+                    args.append(step)
+
+        run(args)
+        scheduler.typed(
+            self._key_count(sequence), sum(step.milliseconds for step in sequence if isinstance(step, Delay))
+        )
+
+    def __key_name(self, key: Key) -> str:
         match key:
             case Key.ENTER:
-                key_name = "return"
+                return "return"
             case Key.TAB:
-                key_name = "tab"
+                return "tab"
             case _:
                 raise Exception("Unknown key")
-
-        run(["wtype", "-k", key_name])
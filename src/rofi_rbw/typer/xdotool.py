@@ -17,8 +17,20 @@ class XDoToolTyper(Typer):
     def get_active_window(self) -> str:
         return run(args=["xdotool", "getactivewindow"], capture_output=True, encoding="utf-8").stdout[:-1]
 
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
-        sleep(start_delay)
+    def get_active_window_with_title(self) -> tuple[str, str | None]:
+        xdotool = run(
+            args=["xdotool", "getactivewindow", "getwindowname", "getactivewindow"],
+            capture_output=True,
+            encoding="utf-8",
+        )
+        title, _, active_window = xdotool.stdout[:-1].rpartition("\n")
+        return active_window, title or None
+
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
+        sleep(start_delay / 1000)
+        self._type_segment([characters], key_delay, active_window)
+
+    def _type_segment(self, segment: list[str | Key], key_delay: int, active_window: str) -> None:
         run(
             [
                 "xdotool",
@@ -29,9 +41,11 @@ class XDoToolTyper(Typer):
                 "--clearmodifiers",
                 "--delay",
                 str(key_delay),
-                "--",
-                characters,
-            ]
+                "--file",
+                "-",
+            ],
+            input=self._as_text(segment),
+            encoding="utf-8",
         )
         # workaround for https://github.com/jordansissel/xdotool/issues/43
         run(["xdotool", "keyup", "Shift_L", "Shift_R", "Alt_L", "Alt_R"])
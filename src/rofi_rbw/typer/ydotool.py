@@ -17,9 +17,12 @@ class YDotoolTyper(Typer):
     def get_active_window(self) -> str:
         return "not possible with ydotool"
 
-    def type_characters(self, characters: str, start_delay: float, key_delay: int, active_window: str) -> None:
-        sleep(start_delay)
-        run(["ydotool", "type", "--key-delay", str(key_delay), characters])
+    def type_characters(self, characters: str, start_delay: int, key_delay: int, active_window: str) -> None:
+        sleep(start_delay / 1000)
+        self._type_segment([characters], key_delay, active_window)
+
+    def _type_segment(self, segment: list[str | Key], key_delay: int, active_window: str) -> None:
+        run(["ydotool", "type", "--key-delay", str(key_delay), self._as_text(segment)])
 
     def press_key(self, key: Key) -> None:
         match key:
@@ -0,0 +1,132 @@
+import json
+import os
+import time
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+baseline_file = Path(__file__).parent / "baseline.json"
+TOLERANCE = 3
+SLACK = 0.001
+REPETITIONS = 5
+MINIMUM_BASELINE = 1e-6
+
+results: dict[str, float] = {}
+
+
+def synthetic_vault(size: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(index),
+            "name": f"entry {index}",
+            "user": f"user{index % 97}@example.com",
+            "folder": f"folder {index % 13}" if index % 3 else None,
+            "type": "Login",
+            "uris": [f"https://site{index}.example.com/login"],
+        }
+        for index in range(size)
+    ]
+
+
+@cache
+def reference_seconds() -> float:
+    timings = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        sorted(str(number * 7919 % 100_003) for number in range(100_000))
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def relative(seconds: float) -> float:
+    return seconds / reference_seconds()
+
+
+def update_baseline() -> bool:
+    return os.environ.get("ROFI_RBW_UPDATE_BASELINE") is not None
+
+
+class Benchmark:
+    def __init__(self, name: str, baseline: float | None):
+        self.name = name
+        self.baseline = baseline
+
+    def measure(self, function: Callable[[], Any]) -> None:
+        timings = []
+        for _ in range(REPETITIONS):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+
+        self.record(min(timings))
+
+    def record(self, seconds: float) -> None:
+        results[self.name] = seconds
+
+        if self.baseline and not update_baseline():
+            baseline_seconds = self.baseline * reference_seconds()
+            assert seconds <= baseline_seconds * TOLERANCE + SLACK, (
+                f"{self.name} took {seconds * 1000:.2f} ms, the baseline is {baseline_seconds * 1000:.2f} ms"
+            )
+
+
+@pytest.fixture
+def benchmark(request) -> Benchmark:
+    baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+    return Benchmark(request.node.name, baseline.get(request.node.name))
+
+
+@pytest.fixture
+def fake_environment(tmp_path) -> dict[str, str]:
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+
+    executables = {
+        "rbw": '#!/bin/sh\ncase "$1" in\n  list) cat "$FAKE_VAULT" ;;\n  unlocked) exit 0 ;;\n  *) exit 1 ;;\nesac\n',
+        "rofi": '#!/bin/sh\ndate +%s.%N > "$FAKE_SPAWN_FILE"\ncat > /dev/null\nexit 1\n',
+        "xdotool": "#!/bin/sh\necho 1\n",
+    }
+    for name, script in executables.items():
+        (bin_directory / name).write_text(script)
+        (bin_directory / name).chmod(0o755)
+
+    environment = {key: value for key, value in os.environ.items() if key not in {"WAYLAND_DISPLAY", "RBW_PROFILE"}}
+    environment.update(
+        {
+            "PATH": f"{bin_directory}:/usr/bin:/bin",
+            "HOME": str(tmp_path),
+            "XDG_CACHE_HOME": str(tmp_path / "cache"),
+            "XDG_CONFIG_HOME": str(tmp_path / "config"),
+            "XDG_RUNTIME_DIR": str(tmp_path),
+            "FAKE_VAULT": str(tmp_path / "vault.json"),
+            "FAKE_SPAWN_FILE": str(tmp_path / "spawned"),
+        }
+    )
+    return environment
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+
+    baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+    terminalreporter.section("benchmarks")
+    for name, seconds in results.items():
+        if baseline.get(name):
+            comparison = f"{relative(seconds) / baseline[name]:6.2f}x baseline"
+        else:
+            comparison = "no baseline"
+        terminalreporter.write_line(f"{name:<50} {seconds * 1000:10.3f} ms  {comparison}")
+
+
+def pytest_sessionfinish(session):
+    if results and update_baseline():
+        baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+        baseline.update(
+            {name: max(float(f"{relative(seconds):.4g}"), MINIMUM_BASELINE) for name, seconds in results.items()}
+        )
+        baseline_file.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
@@ -0,0 +1,92 @@
+import json
+import subprocess
+import sys
+import time
+from subprocess import CompletedProcess
+
+import pytest
+
+from rofi_rbw import cache, rbw
+from rofi_rbw.argument_parsing import parse_arguments
+from rofi_rbw.cache import Cache
+from rofi_rbw.models.display_field_token import DisplayFieldToken
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.rbw import Rbw
+from rofi_rbw.search_index import SearchIndex
+
+from ..DummySelector import DummySelector
+from .conftest import synthetic_vault
+
+pytestmark = pytest.mark.benchmark
+
+sizes = [100, 1_000, 10_000, 50_000]
+display_fields = [DisplayFieldToken.NAME_WITH_FOLDER, DisplayFieldToken.USER]
+
+
+def synthetic_entries(size: int) -> list[Entry]:
+    return [
+        Entry(item["name"], item["folder"] or "", item["user"], item["type"], item["uris"])
+        for item in synthetic_vault(size)
+    ]
+
+
+def test_cold_start(benchmark, fake_environment, tmp_path):
+    (tmp_path / "vault.json").write_text(json.dumps(synthetic_vault(1_000)))
+
+    timings = []
+    for _ in range(5):
+        start = time.time()
+        subprocess.run([sys.executable, "-m", "rofi_rbw"], env=fake_environment, capture_output=True, check=True)
+        timings.append(float((tmp_path / "spawned").read_text()) - start)
+
+    benchmark.record(min(timings))
+
+
+def test_parse_arguments(benchmark):
+    benchmark.measure(lambda: parse_arguments([]))
+
+
+@pytest.mark.parametrize("size", sizes)
+def test_list_entries(benchmark, monkeypatch, size):
+    output = json.dumps(synthetic_vault(size))
+    monkeypatch.setattr(rbw, "run", lambda command, **kwargs: CompletedProcess(command, 0, output, ""))
+
+    benchmark.measure(Rbw().list_entries)
+
+
+@pytest.mark.parametrize("size", sizes)
+def test_format_entries(benchmark, size):
+    entries = synthetic_entries(size)
+
+    benchmark.measure(lambda: DummySelector()._format_entries(entries, display_fields))
+
+
+@pytest.mark.parametrize("size", sizes)
+def test_cache_sorted(benchmark, monkeypatch, tmp_path, size):
+    monkeypatch.setattr(cache, "cache_file", tmp_path / "rofi-rbw.runcache")
+    monkeypatch.setattr(cache, "journal_file", tmp_path / "rofi-rbw.runcache.journal")
+    entries = synthetic_entries(size)
+    now = time.time()
+    (tmp_path / "rofi-rbw.runcache").write_text(
+        "".join(
+            f"{index % 10 + 1} {now - index * 3600:.0f} {entry.hashed}\n" for index, entry in enumerate(entries[:200])
+        )
+    )
+
+    benchmark.measure(lambda: Cache().sorted(entries))
+
+
+@pytest.mark.parametrize("size", sizes)
+def test_find_entry(benchmark, size):
+    selector = DummySelector()
+    last_line = selector._format_entries(synthetic_entries(size), display_fields)[-1]
+
+    benchmark.measure(lambda: selector._find_entry(last_line))
+
+
+@pytest.mark.parametrize("size", sizes)
+def test_search_index(benchmark, size):
+    entries = synthetic_entries(size)
+    index = SearchIndex(entries)
+
+    benchmark.measure(lambda: index.search(f"entyr {size - 1}"))
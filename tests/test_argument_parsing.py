@@ -59,3 +59,9 @@ def test_parse_arguments_no_deprecation_warning_with_display_fields(capsys):
 def test_parse_arguments_action_sequence_delay(argv, expected):
     args = parse_arguments(argv)
     assert args.action_sequence_delay == expected
+
+
+@pytest.mark.parametrize("half_life", ["0", "-5"])
+def test_parse_arguments_rejects_non_positive_cache_half_life(half_life):
+    with pytest.raises(SystemExit):
+        parse_arguments(["--cache-half-life", half_life])
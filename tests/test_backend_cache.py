@@ -0,0 +1,60 @@
+import pytest
+
+from rofi_rbw import backend_cache
+from rofi_rbw.backend_cache import BackendCache
+
+
+@pytest.fixture(autouse=True)
+def environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend_cache, "backend_cache_file", tmp_path / "rofi-rbw.backends")
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+    monkeypatch.setenv("PATH", str(bin_directory))
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    return bin_directory
+
+
+def test_backend_is_remembered():
+    BackendCache().set("typer", "xdotool")
+
+    assert BackendCache().get("typer") == "xdotool"
+
+
+def test_installing_a_tool_invalidates_the_cache(environment):
+    BackendCache().set("typer", "xdotool")
+
+    (environment / "wtype").touch()
+
+    assert BackendCache().get("typer") is None
+
+
+def test_changing_the_session_invalidates_the_cache(monkeypatch):
+    BackendCache().set("typer", "xdotool")
+
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+
+    assert BackendCache().get("typer") is None
+
+
+def test_invalid_cache_is_ignored(tmp_path):
+    (tmp_path / "rofi-rbw.backends").write_text("[]")
+
+    assert BackendCache().get("typer") is None
+
+
+def test_unwritable_cache_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend_cache, "backend_cache_file", tmp_path / "missing" / "rofi-rbw.backends")
+    (tmp_path / "missing").write_text("")
+
+    BackendCache().set("typer", "xdotool")
+
+
+def test_concurrent_writers_do_not_collide(tmp_path):
+    first = BackendCache()
+    second = BackendCache()
+
+    first.set("typer", "xdotool")
+    second.set("typer", "wtype")
+
+    assert BackendCache().get("typer") == "wtype"
+    assert [path.name for path in tmp_path.iterdir() if path.is_file()] == ["rofi-rbw.backends"]
@@ -0,0 +1,94 @@
+import os
+import time
+
+import pytest
+
+from rofi_rbw import cache
+from rofi_rbw.cache import Cache
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+
+entries = [Entry(name=name, folder="", username="", type=EntryType.LOGIN.value) for name in ["a", "b", "c"]]
+a, b, c = entries
+day = 24 * 60 * 60
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "cache_file", tmp_path / "rofi-rbw.runcache")
+    monkeypatch.setattr(cache, "journal_file", tmp_path / "rofi-rbw.runcache.journal")
+    return tmp_path / "rofi-rbw.runcache"
+
+
+def test_unused_entries_keep_their_order():
+    assert Cache().sorted(entries) == entries
+
+
+def test_used_entry_is_sorted_first():
+    Cache().update(c)
+
+    assert Cache().sorted(entries) == [c, a, b]
+
+
+def test_old_usage_decays(cache_file):
+    now = time.time()
+    cache_file.write_text(f"8 {now - 120 * day:.0f} {b.hashed}\n1 {now:.0f} {c.hashed}\n")
+
+    assert Cache(half_life_days=30).sorted(entries) == [c, b, a]
+    assert Cache(half_life_days=365).sorted(entries) == [b, c, a]
+
+
+def test_legacy_cache_file_is_read(cache_file):
+    cache_file.write_text(f"5 {c.hashed}\n2 {b.hashed}\n")
+
+    assert Cache().sorted(entries) == [c, b, a]
+
+
+def test_legacy_usage_decays_from_file_modification(cache_file):
+    cache_file.write_text(f"5 {c.hashed}\n")
+    long_ago = time.time() - 200 * day
+    os.utime(cache_file, (long_ago, long_ago))
+    recent_cache = Cache()
+    recent_cache.sorted(entries)
+    recent_cache.update(a)
+
+    assert Cache().sorted(entries) == [a, c, b]
+
+
+def test_corrupt_lines_are_skipped(cache_file):
+    now = time.time()
+    cache_file.write_text(f"broken {now:.0f} {a.hashed}\n2 {b.hashed}\n")
+    cache.journal_file.write_text(f"{now:.0f} {c.hashed}\n{now:.0f}\n17x {a.hashed}\n")
+
+    assert Cache().sorted(entries) == [b, c, a]
+
+
+def test_concurrent_updates_are_kept():
+    first_instance, second_instance = Cache(), Cache()
+    first_instance.sorted(entries)
+    second_instance.sorted(entries)
+
+    first_instance.update(b)
+    second_instance.update(c)
+    second_instance.update(c)
+
+    assert Cache().sorted(entries) == [c, b, a]
+
+
+def test_compaction_keeps_order(cache_file):
+    for entry in [a, c, c]:
+        Cache().update(entry)
+
+    Cache().compact()
+
+    assert cache.journal_file.read_text() == ""
+    assert len(cache_file.read_text().splitlines()) == 2
+    assert Cache().sorted(entries) == [c, a, b]
+
+
+def test_compaction_forgets_unused_entries(cache_file):
+    cache_file.write_text(f"1 {time.time() - 3650 * day:.0f} {b.hashed}\n")
+
+    Cache().compact()
+
+    assert cache_file.read_text() == ""
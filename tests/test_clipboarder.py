@@ -0,0 +1,164 @@
+import json
+import time
+from subprocess import CompletedProcess, Popen
+
+import pytest
+
+from rofi_rbw import daemon_client
+from rofi_rbw.clipboarder import clipboarder, wlclip
+from rofi_rbw.clipboarder.clipboarder import Clipboarder
+from rofi_rbw.clipboarder.wlclip import WlClipboarder
+
+
+class FakeClipboarder(Clipboarder):
+    def __init__(self):
+        self.content = ""
+        self.cleared = False
+
+    @staticmethod
+    def supported() -> bool:
+        return True
+
+    @staticmethod
+    def name() -> str:
+        return "fake"
+
+    def copy_to_clipboard(self, characters: str) -> None:
+        self.content = characters
+        self._remember(characters)
+
+    def fetch_clipboard_content(self) -> str | None:
+        return self.content
+
+    def clear_clipboard(self) -> None:
+        self.content = ""
+        self.cleared = True
+
+
+class FakePopen:
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.stdin = self
+        self.written = ""
+        helpers.append(self)
+
+    def write(self, text):
+        self.written += text
+
+    def close(self):
+        pass
+
+
+helpers: list[FakePopen] = []
+
+
+@pytest.fixture(autouse=True)
+def without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon_client, "socket_file", tmp_path / "missing.sock")
+    monkeypatch.setattr(clipboarder, "Popen", FakePopen)
+    helpers.clear()
+
+
+def test_clear_is_handed_to_a_detached_helper():
+    fake = FakeClipboarder()
+    fake.copy_to_clipboard("secret")
+
+    fake.clear_clipboard_after(10)
+
+    assert len(helpers) == 1
+    assert helpers[0].args[-3:] == ["rofi_rbw.clipboarder.clearer", "fake", "10"]
+    assert helpers[0].kwargs["start_new_session"]
+    key, digest = helpers[0].written.split()
+    assert "secret" not in helpers[0].written
+    assert digest == Clipboarder.digest("secret", bytes.fromhex(key))
+
+
+def test_nothing_is_cleared_without_timeout():
+    fake = FakeClipboarder()
+    fake.copy_to_clipboard("secret")
+
+    fake.clear_clipboard_after(0)
+
+    assert helpers == []
+
+
+def test_unchanged_clipboard_is_cleared():
+    fake = FakeClipboarder()
+    fake.copy_to_clipboard("secret")
+
+    fake.clear_clipboard_if_unchanged(fake._last_copied_key.hex(), fake._last_copied_digest)
+
+    assert fake.cleared
+
+
+def test_overwritten_clipboard_is_kept():
+    fake = FakeClipboarder()
+    fake.copy_to_clipboard("secret")
+    fake.content = "something else"
+
+    fake.clear_clipboard_if_unchanged(fake._last_copied_key.hex(), fake._last_copied_digest)
+
+    assert not fake.cleared
+
+
+def test_digest_is_keyed():
+    first, second = FakeClipboarder(), FakeClipboarder()
+    first.copy_to_clipboard("secret")
+    second.copy_to_clipboard("secret")
+
+    assert first._last_copied_digest != second._last_copied_digest
+
+
+def test_wayland_clipboard_of_another_application_is_not_read(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return CompletedProcess(args, 0, "text/plain\nUTF8_STRING\n", "")
+
+    monkeypatch.setattr(wlclip, "run", fake_run)
+
+    WlClipboarder().clear_clipboard_if_unchanged("00", "digest")
+
+    assert calls == [["wl-paste", "--list-types"]]
+
+
+def test_queue_is_handed_to_a_detached_helper(monkeypatch):
+    monkeypatch.setattr(FakeClipboarder, "_paste_once_command", lambda self: ["paste-once"])
+
+    assert FakeClipboarder().copy_queue(["user", "secret"], 30)
+
+    assert helpers[0].args[-2:] == ["rofi_rbw.clipboarder.paste_queue", "fake"]
+    assert json.loads(helpers[0].written) == {"values": ["user", "secret"], "clear": 30}
+
+
+def test_queue_is_not_supported_without_paste_once():
+    assert not FakeClipboarder().copy_queue(["user", "secret"], 0)
+    assert helpers == []
+
+
+def test_queue_serves_values_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(clipboarder, "Popen", Popen)
+    log = tmp_path / "pasted"
+    monkeypatch.setattr(
+        FakeClipboarder, "_paste_once_command", lambda self: ["sh", "-c", f"cat >> {log}; echo >> {log}"]
+    )
+
+    FakeClipboarder().serve_queue(["user", "secret"], 0)
+
+    assert log.read_text().splitlines() == ["user", "secret"]
+
+
+def test_queue_is_dropped_after_clear_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(clipboarder, "Popen", Popen)
+    log = tmp_path / "pasted"
+    monkeypatch.setattr(
+        FakeClipboarder, "_paste_once_command", lambda self: ["sh", "-c", f"cat >> {log}; echo >> {log}; sleep 5"]
+    )
+
+    start = time.monotonic()
+    FakeClipboarder().serve_queue(["user", "secret"], 1)
+
+    assert time.monotonic() - start < 3
+    assert log.read_text().splitlines() == ["user"]
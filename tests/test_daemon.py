@@ -0,0 +1,107 @@
+import importlib
+import time
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from rofi_rbw import daemon, daemon_client, paths
+from rofi_rbw.clipboarder.clipboarder import Clipboarder
+from rofi_rbw.daemon import Daemon
+from rofi_rbw.daemon_client import DaemonClient
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+
+from .test_clipboarder import FakeClipboarder
+
+entry = Entry(
+    name="github", folder="personal", username="user", type=EntryType.LOGIN.value, uris=["https://github.com"]
+)
+
+
+class FakeRbw:
+    def __init__(self):
+        self.unlocked = True
+        self.modified = 1.0
+        self.calls = 0
+
+    def is_unlocked(self) -> bool:
+        return self.unlocked
+
+    def database_modified(self) -> float | None:
+        return self.modified
+
+    def list_entries(self) -> list[Entry]:
+        self.calls += 1
+        return [entry]
+
+
+@pytest.fixture
+def served_daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon, "socket_file", tmp_path / "rofi-rbw.sock")
+    monkeypatch.setattr(daemon_client, "socket_file", tmp_path / "rofi-rbw.sock")
+    rofi_rbw_daemon = Daemon()
+    rofi_rbw_daemon.rbw = FakeRbw()
+
+    server = daemon._Server(rofi_rbw_daemon)
+    Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    yield rofi_rbw_daemon
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_receives_entries(served_daemon):
+    assert DaemonClient().list_entries() == [entry]
+
+
+def test_entries_are_kept_between_requests(served_daemon):
+    DaemonClient().list_entries()
+    DaemonClient().list_entries()
+
+    assert served_daemon.rbw.calls == 1
+
+
+def test_entries_are_reloaded_after_sync(served_daemon):
+    DaemonClient().list_entries()
+    served_daemon.rbw.modified = 2.0
+    DaemonClient().list_entries()
+
+    assert served_daemon.rbw.calls == 2
+
+
+def test_locked_vault_is_not_served(served_daemon):
+    DaemonClient().list_entries()
+    served_daemon.rbw.unlocked = False
+
+    assert DaemonClient().list_entries() is None
+    assert served_daemon.entries is None
+
+
+def test_client_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon_client, "socket_file", tmp_path / "missing.sock")
+
+    assert DaemonClient().list_entries() is None
+
+
+def test_socket_depends_on_rbw_profile(monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    monkeypatch.setenv("RBW_PROFILE", "work")
+    try:
+        assert importlib.reload(paths).socket_file == Path("/run/user/1000/rofi-rbw-work.sock")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(paths)
+
+
+def test_daemon_clears_clipboard(served_daemon, monkeypatch):
+    fake = FakeClipboarder()
+    fake.copy_to_clipboard("secret")
+    monkeypatch.setattr(Clipboarder, "best_option", staticmethod(lambda name: fake))
+
+    assert DaemonClient().clear_clipboard_after("fake", 0, fake._last_copied_key.hex(), fake._last_copied_digest)
+
+    for _ in range(100):
+        if fake.cleared:
+            break
+        time.sleep(0.01)
+    assert fake.cleared
@@ -0,0 +1,51 @@
+import pytest
+
+from rofi_rbw.domain_index import DomainIndex, registrable_domain
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+
+github = Entry("github", "", "user", EntryType.LOGIN.value, ["https://github.com/login"])
+gist = Entry("gist", "", "user", EntryType.LOGIN.value, ["gist.github.com"])
+bbc = Entry("bbc", "", "user", EntryType.LOGIN.value, ["https://www.bbc.co.uk:8443/account"])
+router = Entry("router", "", "admin", EntryType.LOGIN.value, ["http://192.168.1.1:8080"])
+bank = Entry("bank", "", "", EntryType.CARD.value, [])
+entries = [bank, router, bbc, gist, github]
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("https://github.com/login", "github.com"),
+        ("accounts.google.com", "google.com"),
+        ("https://www.bbc.co.uk:8443/account", "bbc.co.uk"),
+        ("https://mail.example.com.au", "example.com.au"),
+        ("http://192.168.1.1:8080", "192.168.1.1"),
+        ("localhost:3000", None),
+        ("androidapp://com.example.app", None),
+        ("", None),
+    ],
+)
+def test_registrable_domain(uri, expected):
+    assert registrable_domain(uri) == expected
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("https://gist.github.com/user - Mozilla Firefox", [gist, github, bank, router, bbc]),
+        ("Sign in - www.bbc.co.uk:8443 — Chromium", [bbc, bank, router, gist, github]),
+        ("192.168.1.1:8080/admin", [router, bank, bbc, gist, github]),
+        ("GitHub · Build and ship software - Google Chrome", [gist, github, bank, router, bbc]),
+        ("Terminal", entries),
+        ("Mozilla Firefox", entries),
+    ],
+    ids=["hostname", "subdomain_and_port", "ip_address", "site_name", "no_match", "browser_name"],
+)
+def test_entries_for_the_window_title_are_ranked_first(title, expected):
+    assert DomainIndex(entries).ranked(entries, title) == expected
+
+
+def test_hostname_matches_are_ranked_before_name_matches():
+    other = Entry("other", "", "", EntryType.LOGIN.value, ["https://bbc.com"])
+
+    assert DomainIndex([other, bbc]).ranked([other, bbc], "bbc.co.uk - BBC") == [bbc, other]
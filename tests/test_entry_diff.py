@@ -0,0 +1,42 @@
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.entry_diff import EntryDiff
+from rofi_rbw.models.EntryType import EntryType
+
+github = Entry("github", "", "user", EntryType.LOGIN.value, ["https://github.com"])
+gitlab = Entry("gitlab", "", "user", EntryType.LOGIN.value, ["https://gitlab.com"])
+bank = Entry("bank", "", "", EntryType.CARD.value, [])
+
+
+def test_diff_without_changes():
+    diff = EntryDiff.between([github, gitlab], [github, gitlab])
+
+    assert not diff
+    assert str(diff) == "no changes"
+
+
+def test_diff_detects_added_and_removed_entries():
+    diff = EntryDiff.between([github, bank], [gitlab, github])
+
+    assert diff.added == [gitlab]
+    assert diff.removed == [bank]
+    assert diff.renamed == {}
+    assert str(diff) == "1 added, 1 removed"
+
+
+def test_diff_detects_renamed_entries():
+    renamed = Entry("GitHub", "work", "user", EntryType.LOGIN.value, ["https://github.com"])
+
+    diff = EntryDiff.between([github, gitlab], [gitlab, renamed])
+
+    assert diff.added == []
+    assert diff.removed == []
+    assert diff.renamed == {github.hashed: renamed}
+    assert str(diff) == "1 renamed"
+
+
+def test_apply_keeps_the_order_of_existing_entries():
+    renamed = Entry("GitHub", "", "user", EntryType.LOGIN.value, ["https://github.com"])
+    note = Entry("note", "", "", EntryType.NOTE.value, [])
+    diff = EntryDiff.between([github, gitlab, bank], [bank, renamed, note])
+
+    assert diff.apply([gitlab, github, bank]) == [renamed, bank, note]
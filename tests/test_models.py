@@ -2,8 +2,9 @@ import pytest
 
 from rofi_rbw.models.card import Card
 from rofi_rbw.models.credentials import Credentials
+from rofi_rbw.models.field import Field, FieldType
 from rofi_rbw.models.note import Note
-from rofi_rbw.models.targets import Targets
+from rofi_rbw.models.targets import Target, Targets, TypeTargets
 
 
 @pytest.mark.parametrize(
@@ -27,3 +28,25 @@ def test_default_target_return_values(entry, expected_targets, expected_values):
     assert entry.default_target == expected_targets
     for target, expected in zip(entry.default_target, expected_values, strict=True):
         assert entry[target] == expected
+
+
+def test_field_lookup_uses_first_matching_field():
+    fields = [Field("pin", "1234", FieldType.HIDDEN), Field("pin", "5678", FieldType.HIDDEN)]
+    note = Note("test", "", fields, "")
+
+    assert note[Target("pin")] == "1234"
+    assert note[Target("missing")] is None
+
+
+def test_field_lookup_strips_field_suffix():
+    credentials = Credentials("test", "", [Field("username", "other", FieldType.TEXT)], "user", "pass", False, "", [])
+
+    assert credentials[Targets.USERNAME] == "user"
+    assert credentials[Target("username (field)")] == "other"
+
+
+def test_autotype_sequence_is_parsed_once():
+    card = Card("test", "", [Field("_autotype", "number:tab:code\n", FieldType.TEXT)], number="1234", code="123")
+
+    assert card.autotype_sequence == [Targets.NUMBER, TypeTargets.TAB, Targets.CODE]
+    assert card.autotype_sequence is card.autotype_sequence
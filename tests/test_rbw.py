@@ -0,0 +1,99 @@
+import json
+from subprocess import CompletedProcess
+
+import pytest
+
+from rofi_rbw import rbw
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+from rofi_rbw.rbw import Rbw
+
+github = Entry(name="github", folder="", username="user", type=EntryType.LOGIN.value, uris=[])
+gitlab = Entry(name="gitlab", folder="", username="user", type=EntryType.LOGIN.value, uris=[])
+
+
+class FakeRun:
+    def __init__(self, unlocked: bool = True):
+        self.unlocked = unlocked
+        self.calls = []
+
+    def __call__(self, command, **kwargs):
+        self.calls.append(command)
+        if command[1] == "unlocked":
+            return CompletedProcess(command, 0 if self.unlocked else 1, b"", b"")
+
+        if command[3] == "broken":
+            return CompletedProcess(command, 1, "", "")
+
+        data = {
+            "name": command[3],
+            "folder": None,
+            "notes": None,
+            "fields": [],
+            "data": {"username": "user", "password": f"{command[3]}-password", "totp": None, "uris": []},
+        }
+        return CompletedProcess(command, 0, json.dumps(data), "")
+
+    def gets(self) -> list[str]:
+        return [command[3] for command in self.calls if command[1] == "get"]
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    fake_run = FakeRun()
+    monkeypatch.setattr(rbw, "run", fake_run)
+    return fake_run
+
+
+def test_prefetched_entry_is_not_fetched_again(fake_run):
+    client = Rbw()
+    client.prefetch_credentials([github])
+
+    assert client.fetch_credentials(github).password == "github-password"
+    assert fake_run.gets() == ["github"]
+
+
+def test_entry_without_prefetch_is_fetched(fake_run):
+    client = Rbw()
+    client.prefetch_credentials([github])
+
+    assert client.fetch_credentials(gitlab).password == "gitlab-password"
+    assert "gitlab" in fake_run.gets()
+
+
+def test_locked_vault_is_not_prefetched(fake_run):
+    fake_run.unlocked = False
+    client = Rbw()
+    client.prefetch_credentials([github])
+
+    assert client.fetch_credentials(github).password == "github-password"
+    assert fake_run.gets() == ["github"]
+
+
+def test_fetch_all_credentials_keeps_order(fake_run):
+    entries = [Entry(name=f"entry{i}", folder="", username="", type=EntryType.LOGIN.value) for i in range(20)]
+
+    fetched = Rbw().fetch_all_credentials(entries, workers=4)
+
+    assert [credentials.password for credentials in fetched] == [f"entry{i}-password" for i in range(20)]
+    assert sorted(fake_run.gets()) == sorted(entry.name for entry in entries)
+
+
+def test_fetch_all_credentials_skips_failing_entries(fake_run):
+    broken = Entry(name="broken", folder="", username="", type=EntryType.LOGIN.value)
+
+    fetched = Rbw().fetch_all_credentials([github, broken, gitlab])
+
+    assert fetched[0].password == "github-password"
+    assert fetched[1] is None
+    assert fetched[2].password == "gitlab-password"
+
+
+def test_fetch_all_credentials_unlocks_with_the_first_entry(fake_run):
+    fake_run.unlocked = False
+    entries = [Entry(name=f"entry{i}", folder="", username="", type=EntryType.LOGIN.value) for i in range(5)]
+
+    Rbw().fetch_all_credentials(entries)
+
+    assert fake_run.gets()[0] == "entry0"
+    assert [command[1] for command in fake_run.calls[:2]] == ["unlocked", "get"]
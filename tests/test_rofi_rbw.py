@@ -0,0 +1,163 @@
+from threading import Event
+
+import pytest
+
+from rofi_rbw import backend_cache, daemon_client, search_index
+from rofi_rbw.argument_parsing import parse_arguments
+from rofi_rbw.models.action import Action
+from rofi_rbw.models.credentials import Credentials
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+from rofi_rbw.models.targets import Targets
+from rofi_rbw.rofi_rbw import RofiRbw
+
+entry = Entry(name="github", folder="", username="user", type=EntryType.LOGIN.value, uris=[])
+
+
+class FakeRbw:
+    def __init__(self, synced_entries=None):
+        self.listed = 0
+        self.synced_entries = synced_entries
+        self.released = Event()
+
+    def list_entries(self) -> list[Entry]:
+        self.listed += 1
+        if self.listed > 1:
+            return self.synced_entries
+        return [entry]
+
+    def sync(self) -> bool:
+        self.released.wait(timeout=5)
+        return self.synced_entries is not None
+
+    def database_modified(self) -> float | None:
+        return None
+
+    def fetch_credentials(self, selected: Entry) -> Credentials:
+        return Credentials(selected.name, "", [], selected.username, "secret", False, "", [])
+
+    def prefetch_credentials(self, entries: list[Entry]) -> None:
+        pass
+
+
+class FakeSelector:
+    def __init__(self, selections, target_selections):
+        self.selections = selections
+        self.target_selections = target_selections
+        self.shown_entries = []
+        self.prompts = []
+
+    def configure_target_menu(self, targets, keybindings):
+        pass
+
+    def show_selection(self, entries, prompt, show_help_message, display_fields, keybindings, additional_args):
+        self.shown_entries.append(entries)
+        self.prompts.append(prompt)
+        selection = self.selections.pop(0)
+        return selection() if callable(selection) else selection
+
+    def select_target(self, entry, show_help_message, keybindings, additional_args):
+        return self.target_selections.pop(0)
+
+
+@pytest.fixture
+def rofi_rbw(tmp_path, monkeypatch):
+    monkeypatch.setattr(backend_cache, "backend_cache_file", tmp_path / "rofi-rbw.backends")
+    monkeypatch.setattr(daemon_client, "socket_file", tmp_path / "missing.sock")
+    monkeypatch.setattr(search_index, "search_index_file", tmp_path / "rofi-rbw.index")
+    rofi_rbw = RofiRbw(parse_arguments(["--selector", "rofi", "--action", "print", "--no-cache"]))
+    rofi_rbw.rbw = FakeRbw()
+    return rofi_rbw
+
+
+def test_going_back_from_the_target_menu_reuses_the_entries(rofi_rbw, capsys):
+    rofi_rbw.selector = FakeSelector(
+        [([Targets.MENU], None, entry), ([Targets.MENU], None, entry)],
+        [(None, Action.CANCEL), ([Targets.USERNAME], None)],
+    )
+
+    rofi_rbw.main()
+
+    assert rofi_rbw.rbw.listed == 1
+    assert len(rofi_rbw.selector.shown_entries) == 2
+    assert rofi_rbw.selector.shown_entries[0] is rofi_rbw.selector.shown_entries[1]
+    assert capsys.readouterr().out == "user\n"
+
+
+def test_going_back_keeps_the_default_targets(rofi_rbw, capsys):
+    rofi_rbw.selector = FakeSelector(
+        [([Targets.MENU], None, entry), (None, None, entry)],
+        [(None, Action.CANCEL)],
+    )
+
+    rofi_rbw.main()
+
+    assert capsys.readouterr().out == "user\nsecret\n"
+
+
+def test_cancel(rofi_rbw, capsys):
+    rofi_rbw.selector = FakeSelector([(None, Action.CANCEL, None)], [])
+
+    rofi_rbw.main()
+
+    assert capsys.readouterr().out == ""
+
+
+def finish_sync(rofi_rbw):
+    def selection():
+        rofi_rbw.rbw.released.set()
+        rofi_rbw._RofiRbw__sync.result(timeout=5)
+        return None, Action.SYNC, None
+
+    return selection
+
+
+def test_sync_runs_in_the_background(rofi_rbw):
+    other = Entry(name="gitlab", folder="", username="user", type=EntryType.LOGIN.value, uris=[])
+    rofi_rbw.rbw.synced_entries = [entry, other]
+    rofi_rbw.selector = FakeSelector(
+        [(None, Action.SYNC, None), finish_sync(rofi_rbw), (None, Action.CANCEL, None)],
+        [],
+    )
+
+    rofi_rbw.main()
+
+    assert rofi_rbw.selector.prompts == ["Choose entry", "Choose entry (syncing…)", "Choose entry (synced: 1 added)"]
+    assert rofi_rbw.selector.shown_entries[2] == [entry, other]
+
+
+def test_failed_sync_keeps_the_entries(rofi_rbw):
+    rofi_rbw.selector = FakeSelector(
+        [(None, Action.SYNC, None), finish_sync(rofi_rbw), (None, Action.CANCEL, None)],
+        [],
+    )
+
+    rofi_rbw.main()
+
+    assert rofi_rbw.selector.prompts[2] == "Choose entry (sync failed)"
+    assert rofi_rbw.selector.shown_entries[2] == [entry]
+
+
+def test_filter(rofi_rbw):
+    rofi_rbw.args.filter = "nothing"
+    rofi_rbw.selector = FakeSelector([(None, Action.CANCEL, None)], [])
+
+    rofi_rbw.main()
+
+    assert rofi_rbw.selector.shown_entries == [[]]
+
+
+class FakeTyper:
+    def get_active_window_with_title(self) -> tuple[str, str | None]:
+        return "42", "gitlab.com/explore - Mozilla Firefox"
+
+
+def test_entries_for_the_active_window_are_shown_first(rofi_rbw):
+    other = Entry(name="gitlab", folder="", username="user", type=EntryType.LOGIN.value, uris=["https://gitlab.com"])
+    rofi_rbw.rbw.list_entries = lambda: [entry, other]
+    rofi_rbw.typer = FakeTyper()
+    rofi_rbw.selector = FakeSelector([(None, Action.CANCEL, None)], [])
+
+    rofi_rbw.main()
+
+    assert rofi_rbw.selector.shown_entries == [[other, entry]]
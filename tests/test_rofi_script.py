@@ -0,0 +1,167 @@
+import io
+import shutil
+from pathlib import Path
+
+from rofi_rbw import rbw, search_index
+from rofi_rbw.models.action import Action
+from rofi_rbw.models.credentials import Credentials
+from rofi_rbw.models.display_field_token import DisplayFieldToken
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+from rofi_rbw.models.keybinding import Keybinding
+from rofi_rbw.models.targets import Targets, TypeTargets
+from rofi_rbw.selector import rofi_script
+from rofi_rbw.selector.rofi_script import RofiScript
+
+entries = [
+    Entry(name="github", folder="", username="user", type=EntryType.LOGIN.value, uris=[]),
+    Entry(name="gitlab", folder="", username="other", type=EntryType.LOGIN.value, uris=[]),
+]
+keybindings = [
+    Keybinding("Alt+1", Action.TYPE, [Targets.USERNAME, TypeTargets.TAB, Targets.PASSWORD]),
+    Keybinding("Alt+m", None, [Targets.MENU]),
+    Keybinding("Alt+c", Action.COPY, [Targets.PASSWORD]),
+]
+menu_keybindings = [Keybinding("Alt+t", Action.TYPE, None), Keybinding("Alt+c", Action.COPY, None)]
+
+
+class FakeRbw:
+    def fetch_credentials(self, entry: Entry) -> Credentials:
+        return Credentials(entry.name, "", [], entry.username, "secret", False, "", [])
+
+
+class FakeRofi:
+    def __init__(self, state_directory: Path, calls: list[tuple[int, str]]):
+        self.state_directory = state_directory
+        self.calls = calls
+        self.parameters = []
+
+    def __call__(self, parameters, env):
+        self.parameters = parameters
+        shutil.copy(Path(env["ROFI_RBW_STATE"]) / "state.json", self.state_directory / "state.json")
+        data = ""
+        for retv, info in self.calls:
+            output = io.StringIO()
+            RofiScript().callback(Path(env["ROFI_RBW_STATE"]), retv, data, info, output)
+            options = dict(line[1:].split("\x1f", 1) for line in output.getvalue().splitlines() if line[:1] == "\0")
+            data = options.get("data", data)
+
+
+def show(tmp_path, monkeypatch, calls, targets=None):
+    monkeypatch.setattr(rbw, "Rbw", FakeRbw)
+    fake_rofi = FakeRofi(tmp_path, calls)
+    monkeypatch.setattr(rofi_script, "run", fake_rofi)
+    selector = RofiScript()
+    selector.configure_target_menu(targets, menu_keybindings)
+
+    result = selector.show_selection(entries, "Choose entry", True, [DisplayFieldToken.NAME_ONLY], keybindings, [])
+    return result, fake_rofi
+
+
+def callback(tmp_path, retv=0, data="", info="", text="") -> tuple[dict[str, str], list[str]]:
+    output = io.StringIO()
+    RofiScript().callback(tmp_path, retv, data, info, output, text)
+    lines = output.getvalue().splitlines()
+    return (
+        dict(line[1:].split("\x1f", 1) for line in lines if line[:1] == "\0"),
+        [line for line in lines if line[:1] != "\0"],
+    )
+
+
+def test_entries_are_shown_with_their_index(tmp_path, monkeypatch):
+    show(tmp_path, monkeypatch, [])
+
+    options, rows = callback(tmp_path)
+
+    assert options["prompt"] == "Choose entry"
+    assert options["data"] == "entries"
+    assert "Alt+1" in options["message"]
+    assert rows == ["<b>github</b>\0info\x1f0", "<b>gitlab</b>\0info\x1f1"]
+
+
+def test_shared_shortcuts_are_bound_once(tmp_path, monkeypatch):
+    _, fake_rofi = show(tmp_path, monkeypatch, [])
+
+    assert fake_rofi.parameters.count("Alt+c") == 1
+    assert [
+        fake_rofi.parameters[index + 1]
+        for index in range(len(fake_rofi.parameters) - 1)
+        if fake_rofi.parameters[index].startswith("-kb-custom-")
+    ] == ["Alt+1", "Alt+m", "Alt+c", "Alt+t"]
+
+
+def test_selected_entry_is_returned(tmp_path, monkeypatch):
+    result, _ = show(tmp_path, monkeypatch, [(0, ""), (1, "1")])
+
+    assert result == (None, None, entries[1])
+
+
+def test_keybinding_is_returned(tmp_path, monkeypatch):
+    targets, action, entry = show(tmp_path, monkeypatch, [(0, ""), (10, "0")])[0]
+
+    assert action == Action.TYPE
+    assert targets == [Targets.USERNAME, TypeTargets.TAB, Targets.PASSWORD]
+    assert entry == entries[0]
+
+
+def test_cancel(tmp_path, monkeypatch):
+    assert show(tmp_path, monkeypatch, [(0, "")])[0] == (None, Action.CANCEL, None)
+
+
+def test_menu_is_shown_in_the_same_window(tmp_path, monkeypatch):
+    show(tmp_path, monkeypatch, [])
+
+    options, rows = callback(tmp_path, 11, "entries", "1")
+
+    assert options["prompt"] == "Choose target"
+    assert options["data"] == "targets 1"
+    assert rows == [
+        "Username: other\0info\x1fUsername: other",
+        "Password: s*****\0info\x1fPassword: s*****",
+        "« Back\0info\x1fback",
+    ]
+
+
+def test_target_is_selected_with_menu_keybinding(tmp_path, monkeypatch):
+    targets, action, entry = show(tmp_path, monkeypatch, [(0, ""), (11, "1"), (12, "Password: s*****")])[0]
+
+    assert targets == [Targets.PASSWORD]
+    assert action == Action.COPY
+    assert entry == entries[1]
+
+
+def test_default_menu_target(tmp_path, monkeypatch):
+    targets, action, entry = show(tmp_path, monkeypatch, [(0, ""), (1, "0"), (1, "Username: user")], [Targets.MENU])[0]
+
+    assert targets == [Targets.USERNAME]
+    assert action is None
+    assert entry == entries[0]
+
+
+def test_back_returns_to_the_selected_entry(tmp_path, monkeypatch):
+    show(tmp_path, monkeypatch, [])
+
+    options, rows = callback(tmp_path, 1, "targets 1", "back")
+
+    assert options["data"] == "entries"
+    assert options["new-selection"] == "1"
+    assert len(rows) == 2
+
+
+def test_sync(tmp_path, monkeypatch):
+    sync = Keybinding("Alt+s", Action.SYNC, None)
+    keybindings.append(sync)
+    try:
+        assert show(tmp_path, monkeypatch, [(0, ""), (13, "0")])[0] == (None, Action.SYNC, None)
+    finally:
+        keybindings.remove(sync)
+
+
+def test_custom_input_searches_the_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_index, "search_index_file", tmp_path / "rofi-rbw.index")
+    show(tmp_path, monkeypatch, [])
+
+    options, rows = callback(tmp_path, 2, "entries", "", "gitlba")
+
+    assert options["data"] == "entries"
+    assert rows == ["<b>gitlab</b>\0info\x1f1"]
@@ -1,3 +1,5 @@
+from subprocess import CompletedProcess
+
 import pytest
 
 from rofi_rbw.models.display_field_token import DisplayFieldToken
@@ -64,5 +66,29 @@ def test_rofi_format_entries(tokens, expected):
 )
 def test_rofi_find_entry(tokens, index):
     formatted = rofi._format_entries([default_entry, second_entry], tokens)[index]
-    found = rofi._find_entry([default_entry, second_entry], formatted, tokens)
+    found = rofi._find_entry(formatted)
     assert found == [default_entry, second_entry][index]
+
+
+def test_rofi_restores_the_previous_selection(monkeypatch):
+    calls = []
+
+    def run_with_lines(parameters, lines):
+        calls.append(parameters)
+        list(lines)
+        return CompletedProcess(parameters, 0, stdout="1 git\n")
+
+    selector = Rofi()
+    monkeypatch.setattr(selector, "_run_with_lines", run_with_lines)
+    entries = [default_entry, second_entry]
+
+    assert selector.show_selection(entries, "Choose", False, [DisplayFieldToken.NAME_ONLY], [], []) == (
+        None,
+        None,
+        second_entry,
+    )
+    selector.show_selection(entries, "Choose", False, [DisplayFieldToken.NAME_ONLY], [], [])
+
+    assert "-selected-row" not in calls[0]
+    assert calls[1][calls[1].index("-selected-row") + 1] == "1"
+    assert calls[1][calls[1].index("-filter") + 1] == "git"
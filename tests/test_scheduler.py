@@ -0,0 +1,35 @@
+from rofi_rbw.scheduler import Scheduler
+
+
+def test_start_delay_is_in_milliseconds():
+    scheduler = Scheduler(start_delay=50)
+
+    scheduler.start()
+
+    assert scheduler.timings[0].step == "start delay"
+    assert scheduler.timings[0].planned == 0.05
+    assert scheduler.timings[0].actual >= 0.05
+
+
+def test_timings_report_planned_and_actual_times():
+    scheduler = Scheduler(key_delay=10)
+
+    scheduler.start()
+    scheduler.typed(4)
+    scheduler.wait(30)
+    scheduler.typed(2)
+
+    assert [timing.step for timing in scheduler.timings] == ["start delay", "type 4 keys", "delay 30 ms", "type 2 keys"]
+    assert [round(timing.planned, 3) for timing in scheduler.timings] == [0.0, 0.04, 0.07, 0.09]
+    assert scheduler.timings[2].actual - scheduler.timings[1].actual >= 0.03
+    assert all(earlier.actual <= later.actual for earlier, later in zip(scheduler.timings, scheduler.timings[1:]))
+
+
+def test_wait_is_measured_from_the_last_step():
+    scheduler = Scheduler()
+
+    scheduler.start()
+    scheduler.wait(20)
+    scheduler.wait(20)
+
+    assert scheduler.timings[-1].actual >= 0.04
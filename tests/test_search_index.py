@@ -0,0 +1,75 @@
+import pytest
+
+from rofi_rbw import search_index
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+from rofi_rbw.search_index import SearchIndex
+
+github = Entry("github", "", "user", EntryType.LOGIN.value, ["https://github.com/login"])
+gitlab = Entry("gitlab", "work", "someone", EntryType.LOGIN.value, ["https://gitlab.example.com"])
+bank = Entry("bank", "finance", "", EntryType.CARD.value, [])
+entries = [github, gitlab, bank]
+
+
+@pytest.fixture(autouse=True)
+def index_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_index, "search_index_file", tmp_path / "rofi-rbw.index")
+    return tmp_path / "rofi-rbw.index"
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("github", [github]),
+        ("GitLab", [gitlab]),
+        ("githbu", [github]),
+        ("finance", [bank]),
+        ("someone", [gitlab]),
+        ("example.com", [gitlab]),
+        ("gi", [github, gitlab]),
+        ("https", []),
+        ("nothing", []),
+    ],
+    ids=["name", "case", "typo", "folder", "username", "uri", "short", "scheme", "no_match"],
+)
+def test_search(query, expected):
+    assert SearchIndex(entries).search(query) == expected
+
+
+def test_search_ranks_exact_matches_first():
+    githab = Entry("githab", "", "", EntryType.LOGIN.value, [])
+
+    assert SearchIndex([githab, github]).search("github") == [github, githab]
+
+
+def test_search_breaks_ties_with_the_given_order():
+    assert SearchIndex(entries).search("git", [gitlab, bank, github]) == [gitlab, github]
+
+
+def test_empty_query_returns_everything():
+    assert SearchIndex(entries).search("", [bank, github, gitlab]) == [bank, github, gitlab]
+
+
+def test_index_is_persisted(index_file):
+    SearchIndex.for_entries(entries)
+    assert index_file.exists()
+
+    index = SearchIndex.for_entries(list(reversed(entries)))
+
+    assert index.entries == entries
+    assert index.search("githbu") == [github]
+
+
+def test_index_is_rebuilt_for_changed_entries(index_file):
+    SearchIndex.for_entries(entries)
+
+    index = SearchIndex.for_entries([github, bank])
+
+    assert index.entries == [github, bank]
+    assert index.search("gitlab") == []
+
+
+def test_corrupt_index_is_rebuilt(index_file):
+    index_file.write_text("{")
+
+    assert SearchIndex.for_entries(entries).search("bank") == [bank]
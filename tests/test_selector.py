@@ -139,5 +139,46 @@ def test_format_entries_padding(entries, tokens, expected):
 )
 def test_find_entry(entries, tokens, index):
     formatted = dummy_selector._format_entries(entries, tokens)[index]
-    found = dummy_selector._find_entry(entries, formatted, tokens)
+    found = dummy_selector._find_entry(formatted)
     assert found == entries[index]
+
+
+def test_run_with_lines_streams_to_stdin():
+    result = dummy_selector._run_with_lines(["cat"], iter(["first", "second"]))
+    assert result.returncode == 0
+    assert result.stdout == "first\nsecond\n"
+
+
+def test_run_with_lines_selector_exits_early():
+    result = dummy_selector._run_with_lines(["true"], ("line" for _ in range(100_000)))
+    assert result.returncode == 0
+
+
+def test_run_with_lines_selector_writes_to_stderr_first():
+    result = dummy_selector._run_with_lines(
+        ["sh", "-c", "head -c 1000000 /dev/zero >&2; wc -l"], ("line" for _ in range(100_000))
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "100000"
+
+
+def test_find_entry_with_duplicate_lines():
+    duplicate_entry = Entry(name="github", folder="work", username="user", type=EntryType.LOGIN, uris=[])
+    entries = [default_entry, duplicate_entry]
+    tokens = [DisplayFieldToken.NAME_ONLY, DisplayFieldToken.USER]
+
+    formatted = dummy_selector._format_entries(entries, tokens)
+
+    assert formatted[0] != formatted[1]
+    assert dummy_selector._find_entry(f"{formatted[0]}\n") == default_entry
+    assert dummy_selector._find_entry(f"{formatted[1]}\n") == duplicate_entry
+
+
+def test_formatted_entries_are_reused(monkeypatch):
+    selector = DummySelector()
+    entries = [default_entry]
+    tokens = [DisplayFieldToken.NAME_ONLY, DisplayFieldToken.USER]
+    first = selector._format_entries(entries, tokens)
+    monkeypatch.setattr(selector, "_format_field", lambda entry, token: pytest.fail("formatted again"))
+
+    assert selector._format_entries(entries, tokens) == first
@@ -0,0 +1,50 @@
+import pytest
+
+from rofi_rbw import snapshot
+from rofi_rbw.models.entry import Entry
+from rofi_rbw.models.EntryType import EntryType
+from rofi_rbw.snapshot import Snapshot
+
+entries = [
+    Entry(name="github", folder="personal", username="user", type=EntryType.LOGIN.value, uris=["https://github.com"]),
+    Entry(name="note", folder="", username="", type=EntryType.NOTE.value, uris=[]),
+]
+
+
+@pytest.fixture(autouse=True)
+def snapshot_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "snapshot_file", tmp_path / "rofi-rbw.snapshot")
+    return tmp_path / "rofi-rbw.snapshot"
+
+
+def test_snapshot_round_trip():
+    Snapshot().save(entries, 1.0)
+
+    assert Snapshot().load(1.0) == entries
+
+
+def test_snapshot_is_private(snapshot_file):
+    Snapshot().save(entries, 1.0)
+
+    assert snapshot_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_snapshot_is_ignored_after_sync():
+    Snapshot().save(entries, 1.0)
+
+    assert Snapshot().load(2.0) is None
+
+
+def test_snapshot_without_database():
+    Snapshot().save(entries, None)
+
+    assert Snapshot().load(None) is None
+
+
+def test_unwritable_snapshot_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "snapshot_file", tmp_path / "missing" / "rofi-rbw.snapshot")
+    (tmp_path / "missing").write_text("")
+
+    Snapshot().save(entries, 1.0)
+
+    assert Snapshot().load(1.0) is None
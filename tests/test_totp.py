@@ -0,0 +1,59 @@
+import base64
+
+import pytest
+
+from rofi_rbw.models.credentials import Credentials
+from rofi_rbw.models.targets import Targets
+from rofi_rbw.models.totp import Totp
+
+sha1_secret = base64.b32encode(b"12345678901234567890").decode()
+sha256_secret = base64.b32encode(b"12345678901234567890123456789012").decode()
+sha512_secret = base64.b32encode(b"1234567890" * 6 + b"1234").decode()
+
+
+@pytest.mark.parametrize(
+    ("now", "algorithm", "secret", "expected"),
+    [
+        (59, "SHA1", sha1_secret, "94287082"),
+        (59, "SHA256", sha256_secret, "46119246"),
+        (59, "SHA512", sha512_secret, "90693936"),
+        (1111111109, "SHA1", sha1_secret, "07081804"),
+        (1111111109, "SHA256", sha256_secret, "68084774"),
+        (1111111109, "SHA512", sha512_secret, "25091201"),
+        (20000000000, "SHA1", sha1_secret, "65353130"),
+    ],
+)
+def test_rfc_6238_vectors(now, algorithm, secret, expected):
+    totp = Totp.parse(f"otpauth://totp/test?secret={secret}&digits=8&algorithm={algorithm}")
+
+    assert totp.code(now) == expected
+
+
+def test_plain_secret():
+    assert Totp.parse(sha1_secret.lower()).code(59) == "287082"
+
+
+def test_steam_secret():
+    code = Totp.parse(f"steam://{sha1_secret}").code(59)
+
+    assert len(code) == 5
+    assert set(code) <= set("23456789BCDFGHJKMNPQRTVWXY")
+
+
+def test_remaining_validity():
+    assert Totp.parse(sha1_secret).remaining(59) == 1
+    assert Totp.parse(sha1_secret).remaining(60) == 30
+
+
+@pytest.mark.parametrize("secret", ["not base32!", "otpauth://hotp/test?secret=GEZDGNBV", "otpauth://totp/test"])
+def test_invalid_secrets(secret):
+    with pytest.raises(ValueError):
+        Totp.parse(secret)
+
+
+def test_credentials_compute_totp_without_rbw(monkeypatch):
+    credentials = Credentials("test", "", [], "user", "pass", True, "", [], totp_secret=sha1_secret)
+
+    assert credentials[Targets.TOTP] == credentials.totp
+    assert len(credentials.totp) == 6
+    assert 0 < credentials.totp_validity <= 30
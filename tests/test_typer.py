@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+from subprocess import CompletedProcess
+from threading import Thread
+
+import pytest
+
+from rofi_rbw.scheduler import Scheduler
+from rofi_rbw.typer import wtype, xdotool, ydotool
+from rofi_rbw.typer.dotool import DotoolTyper
+from rofi_rbw.typer.typer import Delay, Key
+from rofi_rbw.typer.wtype import WTypeTyper
+from rofi_rbw.typer.xdotool import XDoToolTyper
+from rofi_rbw.typer.ydotool import YDotoolTyper
+
+login = ["user", Key.TAB, "password", Key.ENTER]
+
+
+class FakeRun:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, args, input=None, **kwargs):
+        self.calls.append((args, input))
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    fake_run = FakeRun()
+    for module in [wtype, xdotool, ydotool]:
+        monkeypatch.setattr(module, "run", fake_run)
+    return fake_run
+
+
+def test_xdotool_types_login_at_once(fake_run):
+    XDoToolTyper().type_sequence(login, Scheduler(0, 5), "42")
+
+    assert len(fake_run.calls) == 2
+    args, input = fake_run.calls[0]
+    assert args[:4] == ["xdotool", "windowactivate", "--sync", "42"]
+    assert args[-2:] == ["--file", "-"]
+    assert input == "user\tpassword\n"
+
+
+def test_xdotool_splits_at_delays(fake_run):
+    XDoToolTyper().type_sequence(["user", Delay(0), "password"], Scheduler(), "42")
+
+    assert [input for _, input in fake_run.calls if input] == ["user", "password"]
+
+
+def test_xdotool_reads_window_and_title_at_once(monkeypatch):
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        return CompletedProcess(args, 0, stdout="GitHub - Mozilla Firefox\n42\n")
+
+    monkeypatch.setattr(xdotool, "run", run)
+
+    assert XDoToolTyper().get_active_window_with_title() == ("42", "GitHub - Mozilla Firefox")
+    assert len(calls) == 1
+
+
+def test_ydotool_types_login_at_once(fake_run):
+    YDotoolTyper().type_sequence(login, Scheduler(0, 5), "")
+
+    assert fake_run.calls == [(["ydotool", "type", "--key-delay", "5", "user\tpassword\n"], None)]
+
+
+def test_wtype_types_sequence_at_once(fake_run):
+    WTypeTyper().type_sequence(["user", Key.TAB, Delay(200), "password", Key.ENTER], Scheduler(), "")
+
+    assert fake_run.calls == [(["wtype", "user", "-k", "tab", "-s", "200", "password", "-k", "return"], None)]
+
+
+def test_wtype_falls_back_for_leading_dash(fake_run):
+    WTypeTyper().type_sequence(["user", Key.TAB, "-password"], Scheduler(), "")
+
+    assert [args for args, _ in fake_run.calls] == [
+        ["wtype", "--", "user"],
+        ["wtype", "-k", "tab"],
+        ["wtype", "--", "-password"],
+    ]
+
+
+@pytest.fixture
+def fake_dotool(tmp_path, monkeypatch):
+    log = tmp_path / "dotool.log"
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+    (bin_directory / "dotool").write_text(
+        f"""#!{sys.executable}
+import sys, time
+with open({str(log)!r}, "a") as log:
+    log.write("spawn\\n")
+    for line in sys.stdin:
+        log.write(f"{{time.monotonic()}} {{line}}")
+"""
+    )
+    (bin_directory / "dotool").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_directory}:{os.environ['PATH']}")
+    monkeypatch.setenv("DOTOOL_PIPE", str(tmp_path / "missing-pipe"))
+    return log
+
+
+def read_dotool_log(log) -> list[tuple[float, str]]:
+    return [
+        (0.0, line) if line == "spawn" else (float(line.split(" ", 1)[0]), line.split(" ", 1)[1])
+        for line in log.read_text().splitlines()
+    ]
+
+
+def test_dotool_types_sequence_with_one_process(fake_dotool):
+    typer = DotoolTyper()
+    typer.type_sequence(["user", Key.TAB, "multi\nline", Key.ENTER], Scheduler(0, 5), "")
+    typer.press_key(Key.ENTER)
+    typer.close()
+
+    assert [command for _, command in read_dotool_log(fake_dotool)] == [
+        "spawn",
+        "typedelay 5",
+        "type user",
+        "key tab",
+        "type multi",
+        "key enter",
+        "type line",
+        "key enter",
+        "key enter",
+    ]
+
+
+def test_dotool_waits_for_delays(fake_dotool):
+    start = time.monotonic()
+    typer = DotoolTyper()
+    typer.type_sequence(["user", Delay(200), "password"], Scheduler(), "")
+    typer.close()
+
+    log = read_dotool_log(fake_dotool)
+    assert [command for _, command in log] == ["spawn", "typedelay 0", "type user", "type password"]
+    assert log[3][0] - start >= 0.2
+
+
+def test_dotool_uses_dotoold_pipe(tmp_path, monkeypatch):
+    pipe = tmp_path / "dotool-pipe"
+    os.mkfifo(pipe)
+    monkeypatch.setenv("DOTOOL_PIPE", str(pipe))
+    received = []
+    reader = Thread(target=lambda: received.extend(pipe.read_text().splitlines()), daemon=True)
+    reader.start()
+    time.sleep(0.05)
+
+    typer = DotoolTyper()
+    typer.type_sequence(["user", Key.ENTER], Scheduler(), "")
+    typer.close()
+    reader.join(timeout=5)
+
+    assert received == ["typedelay 0", "type user", "key enter"]
+
+
+def test_start_delay_is_applied_once_per_sequence(fake_run, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(xdotool, "sleep", sleeps.append)
+    scheduler = Scheduler(start_delay=100)
+
+    XDoToolTyper().type_sequence(["user", Delay(0), "password", Delay(0), "code"], scheduler, "42")
+
+    assert sleeps == []
+    assert [timing.step for timing in scheduler.timings].count("start delay") == 1
+    assert scheduler.timings[0].actual >= 0.1